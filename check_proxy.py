@@ -3,34 +3,13 @@ Diagnostic Script for Proxy Allowances
 This checks if the Proxy Wallet (FUNDER_ADDRESS) has the necessary approvals.
 """
 
-import os
-import time
-from dotenv import load_dotenv
 from web3 import Web3
-from eth_account import Account
 
-load_dotenv()
-
-# Polygon RPC endpoints (try multiple)
-POLYGON_RPCS = [
-    "https://polygon.llamarpc.com",
-    "https://polygon-rpc.com",
-    "https://rpc-mainnet.maticvigil.com",
-    "https://polygon-mainnet.public.blastapi.io",
-]
-
-# Contract addresses (Polygon Mainnet)
-USDC_ADDRESS = "0x2791Bca1f2de4661ED88A30C99A7a9449Aa84174"
-CONDITIONAL_TOKENS_ADDRESS = "0x4D97DCd97eC945f40cF65F87097ACe5EA0476045"
-
-# Exchange contracts to approve
-EXCHANGE_CONTRACTS = [
-    "0x4bFb41d5B3570DeFd03C39a9A4D8dE6Bd8B8982E",  # Main exchange (CTF)
-    "0xC5d563A36AE78145C45a50134d48A1215220f80a",  # Neg risk exchange
-    "0xd91E80cF2E7be2e162c6513ceD06f1dD0dA35296",  # Neg risk adapter
-]
-
-MAX_UINT256 = 2**256 - 1
+from config import FUNDER_ADDRESS, EXCHANGE_CONTRACTS
+from polygon_rpc import (
+    connect_fastest_rpc, multicall_read,
+    USDC_CHECKSUM, CONDITIONAL_TOKENS_CHECKSUM, EXCHANGES_CHECKSUM
+)
 
 ERC20_ABI = [
     {"constant": True, "inputs": [{"name": "owner", "type": "address"}, {"name": "spender", "type": "address"}], "name": "allowance", "outputs": [{"name": "", "type": "uint256"}], "type": "function"},
@@ -41,8 +20,9 @@ ERC1155_ABI = [
     {"constant": True, "inputs": [{"name": "account", "type": "address"}, {"name": "operator", "type": "address"}], "name": "isApprovedForAll", "outputs": [{"name": "", "type": "bool"}], "type": "function"}
 ]
 
+
 def check_proxy_allowances():
-    proxy_address = os.getenv("FUNDER_ADDRESS", "")
+    proxy_address = FUNDER_ADDRESS
     if not proxy_address:
         print("❌ FUNDER_ADDRESS not found in .env")
         return
@@ -50,40 +30,51 @@ def check_proxy_allowances():
     print(f"📍 Checking PROXY Address: {proxy_address}")
     
     # Connect
-    w3 = None
-    for rpc in POLYGON_RPCS:
-        print(f"🔌 Trying {rpc}...")
-        try:
-            w3 = Web3(Web3.HTTPProvider(rpc, request_kwargs={'timeout': 10}))
-            if w3.is_connected():
-                print(f"✅ Connected to Polygon (Chain ID: {w3.eth.chain_id})")
-                break
-        except Exception as e:
-            print(f"  ❌ Failed: {e}")
-            continue
-            
-    if not w3: return
+    w3 = connect_fastest_rpc()
+    if not w3:
+        print("❌ Failed to connect to any Polygon RPC")
+        return
+    print(f"✅ Connected to Polygon (Chain ID: {w3.eth.chain_id})")
 
-    usdc = w3.eth.contract(address=Web3.to_checksum_address(USDC_ADDRESS), abi=ERC20_ABI)
-    conditional_tokens = w3.eth.contract(address=Web3.to_checksum_address(CONDITIONAL_TOKENS_ADDRESS), abi=ERC1155_ABI)
+    usdc = w3.eth.contract(address=USDC_CHECKSUM, abi=ERC20_ABI)
+    conditional_tokens = w3.eth.contract(address=CONDITIONAL_TOKENS_CHECKSUM, abi=ERC1155_ABI)
     
     proxy_checksum = Web3.to_checksum_address(proxy_address)
     
+    # Resolve contract functions once, outside the per-exchange loop
+    balance_fn = usdc.functions.balanceOf
+    allowance_fn = usdc.functions.allowance
+    is_approved_fn = conditional_tokens.functions.isApprovedForAll
+    
+    # Bundle every read into ONE eth_call via Multicall3:
+    # [balanceOf, allowance(ex1), isApprovedForAll(ex1), allowance(ex2), ...]
+    calls = [(USDC_CHECKSUM, balance_fn(proxy_checksum)._encode_transaction_data())]
+    for addr in EXCHANGES_CHECKSUM:
+        calls.append((USDC_CHECKSUM, allowance_fn(proxy_checksum, addr)._encode_transaction_data()))
+        calls.append((CONDITIONAL_TOKENS_CHECKSUM, is_approved_fn(proxy_checksum, addr)._encode_transaction_data()))
+    
+    results = multicall_read(w3, calls)
+    
+    def decode(index, output_type):
+        data = results[index]
+        if data is None:
+            return None
+        return w3.codec.decode([output_type], data)[0]
+    
     # Check USDC Balance
-    bal = usdc.functions.balanceOf(proxy_checksum).call()
-    print(f"\n💰 Proxy USDC Balance: {bal / 1e6}")
+    bal = decode(0, 'uint256')
+    print(f"\n💰 Proxy USDC Balance: {bal / 1e6 if bal is not None else '❌ call failed'}")
 
     print("\n🔍 ALLOWANCE CHECK:")
-    for exchange in EXCHANGE_CONTRACTS:
-        addr = Web3.to_checksum_address(exchange)
+    for i, exchange in enumerate(EXCHANGE_CONTRACTS):
         print(f"\n🏭 Exchange: {exchange[:10]}...")
         
         # USDC
-        allowance = usdc.functions.allowance(proxy_checksum, addr).call()
+        allowance = decode(1 + 2 * i, 'uint256') or 0
         print(f"   USDC Allowance: {'✅ OK' if allowance > 0 else '❌ MSSING'} ({allowance})")
         
         # Tokens
-        approved = conditional_tokens.functions.isApprovedForAll(proxy_checksum, addr).call()
+        approved = decode(2 + 2 * i, 'bool')
         print(f"   Conditional Tokens: {'✅ OK' if approved else '❌ MISSING (Review Required)'}")
 
 if __name__ == "__main__":
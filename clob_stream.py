@@ -0,0 +1,150 @@
+"""
+CLOB Stream - Push updates from Polymarket's CLOB WebSocket channels.
+Runs its own event loop in a daemon thread so the (sync) client can read
+the caches it feeds at any time.
+"""
+
+import asyncio
+import logging
+import threading
+from typing import Any, Callable, Dict, Optional
+
+import aiohttp
+import orjson
+
+from config import CLOB_WS_HOST
+
+logger = logging.getLogger(__name__)
+
+# Server drops idle sockets - keep them alive with a text PING
+PING_INTERVAL = 10
+
+# Reconnect backoff (seconds)
+RECONNECT_MIN_DELAY = 1.0
+RECONNECT_MAX_DELAY = 30.0
+
+
+class ClobStream:
+    """
+    One WebSocket channel subscription (e.g. "user" or "market").
+    KISS: Connect, subscribe, hand every event to a callback, reconnect forever.
+    """
+
+    def __init__(
+        self,
+        channel: str,
+        subscription: Dict[str, Any],
+        on_event: Callable[[Dict[str, Any]], None],
+        on_connect: Optional[Callable[[], None]] = None
+    ):
+        """
+        Args:
+            channel: Channel name, appended to CLOB_WS_HOST/ws/
+            subscription: Message sent right after connecting
+            on_event: Called (from the stream thread) for every event received
+            on_connect: Called (from the stream thread) after every (re)subscription,
+                before any event of the new connection is delivered
+        """
+        self.channel = channel
+        self._url = f"{CLOB_WS_HOST}/ws/{channel}"
+        self._subscription = subscription
+        self._on_event = on_event
+        self._on_connect = on_connect
+        self._connected = threading.Event()
+        self._stopped = False
+        self._thread: Optional[threading.Thread] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._ws = None
+
+    @property
+    def is_healthy(self) -> bool:
+        """True while subscribed; data fed by this stream is current."""
+        return self._connected.is_set()
+
+    def start(self) -> None:
+        """Start the background thread (idempotent)."""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=lambda: asyncio.run(self._run_forever()),
+            name=f"clob-ws-{self.channel}",
+            daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Close the socket and stop reconnecting."""
+        self._stopped = True
+        self._connected.clear()
+
+        loop, ws = self._loop, self._ws
+        if loop is not None and ws is not None:
+            try:
+                asyncio.run_coroutine_threadsafe(ws.close(), loop)
+            except RuntimeError:
+                pass  # Loop already closed
+
+    async def _run_forever(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        delay = RECONNECT_MIN_DELAY
+
+        async with aiohttp.ClientSession() as session:
+            while not self._stopped:
+                try:
+                    async with session.ws_connect(self._url) as ws:
+                        self._ws = ws
+                        await ws.send_str(orjson.dumps(self._subscription).decode())
+                        self._connected.set()
+                        delay = RECONNECT_MIN_DELAY
+                        logger.info(f"📡 WS {self.channel} channel connected")
+
+                        if self._on_connect:
+                            self._on_connect()
+
+                        pinger = asyncio.create_task(self._ping(ws))
+                        try:
+                            async for msg in ws:
+                                if self._stopped:
+                                    break
+                                if msg.type == aiohttp.WSMsgType.TEXT:
+                                    self._dispatch(msg.data)
+                                elif msg.type in (aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.ERROR):
+                                    break
+                        finally:
+                            pinger.cancel()
+
+                except Exception as e:
+                    logger.warning(f"⚠️ WS {self.channel} error: {e}")
+                finally:
+                    self._connected.clear()
+                    self._ws = None
+
+                if self._stopped:
+                    break
+
+                logger.warning(f"🔌 WS {self.channel} disconnected. Reconnecting in {delay:.0f}s...")
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, RECONNECT_MAX_DELAY)
+
+    async def _ping(self, ws) -> None:
+        while True:
+            await asyncio.sleep(PING_INTERVAL)
+            await ws.send_str("PING")
+
+    def _dispatch(self, raw: str) -> None:
+        """Decode a frame (single event or list of events) and hand events to on_event."""
+        if raw == "PONG":
+            return
+
+        try:
+            payload = orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            logger.debug(f"WS {self.channel}: non-JSON frame: {raw[:80]}")
+            return
+
+        events = payload if isinstance(payload, list) else (payload,)
+        for event in events:
+            try:
+                self._on_event(event)
+            except Exception as e:
+                logger.error(f"❌ WS {self.channel} handler error: {e}")
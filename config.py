@@ -14,8 +14,35 @@ load_dotenv()
 # ===========================================
 CLOB_HOST = "https://clob.polymarket.com"
 GAMMA_API = "https://gamma-api.polymarket.com"
+CLOB_WS_HOST = "wss://ws-subscriptions-clob.polymarket.com"  # Push channels (user/market)
 CHAIN_ID = 137  # Polygon Mainnet
 
+# ===========================================
+# ON-CHAIN (Polygon) - setup/diagnostic scripts
+# ===========================================
+# Polygon RPC endpoints (try multiple)
+POLYGON_RPCS = [
+    "https://polygon.llamarpc.com",
+    "https://polygon-rpc.com",
+    "https://rpc-mainnet.maticvigil.com",
+    "https://polygon-mainnet.public.blastapi.io",
+]
+
+# Contract addresses (Polygon Mainnet)
+USDC_ADDRESS = "0x2791Bca1f2de4661ED88A30C99A7a9449Aa84174"
+CONDITIONAL_TOKENS_ADDRESS = "0x4D97DCd97eC945f40cF65F87097ACe5EA0476045"
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"  # Same on every EVM chain
+
+# Exchange contracts to approve
+EXCHANGE_CONTRACTS = [
+    "0x4bFb41d5B3570DeFd03C39a9A4D8dE6Bd8B8982E",  # Main exchange (CTF)
+    "0xC5d563A36AE78145C45a50134d48A1215220f80a",  # Neg risk exchange
+    "0xd91E80cF2E7be2e162c6513ceD06f1dD0dA35296",  # Neg risk adapter
+]
+
+# Maximum approval amount
+MAX_UINT256 = 2**256 - 1
+
 # ===========================================
 # CREDENTIALS (from .env)
 # ===========================================
@@ -56,10 +83,17 @@ EXIT_PRICES = {
     0.37: 0.45,  # 37 → 45 (8¢ profit)
 }
 
+# Same table indexed by integer entry cents: EXIT_PRICES_CENTS[48] == 49
+# (plain list indexing in the fill path, no float-keyed dict lookups)
+EXIT_PRICES_CENTS = [None] * 100
+for _entry, _exit in EXIT_PRICES.items():
+    EXIT_PRICES_CENTS[round(_entry * 100)] = round(_exit * 100)
+
 # Stop-loss configuration (only for high-risk entries)
 # Only 48¢ entries have a stop-loss due to tight margin
 STOP_LOSS_PRICE = 0.18  # 18¢ stop-loss
-STOP_LOSS_ENTRIES = [0.48]  # Only apply to these entry levels
+STOP_LOSS_ENTRIES = frozenset({0.48})  # Only apply to these entry levels
+STOP_LOSS_ENTRIES_CENTS = frozenset(round(_entry * 100) for _entry in STOP_LOSS_ENTRIES)
 
 # Size per order (in shares)
 ORDER_SIZE = 30.0
@@ -86,10 +120,13 @@ MIN_NOTIONAL = 1.0  # Minimum $ notional per order (dynamic $1 USDC rule)
 #   - Practical recommendation: 5-10 orders/s
 #
 # Our usage per cycle (~2 events, 18 orders each):
-#   - ~1 get_open_orders + ~4 get_order_book + ~36 get_order = ~41 req/cycle
-#   - At 0.5s poll: 82 req/s (safe, under 90/s limit)
+#   - WebSockets healthy: open orders, books and order status come from the streams,
+#     so a normal cycle makes no GET at all. Every 30s a reconcile pass does
+#     1 get_orders + one get_order per order that left the open list / sits at 46¢+.
+#   - Streams down (worst case): 1 get_orders + 1 get_order_books + up to ~36 get_order
+#     = ~38 req/cycle, i.e. 76 req/s at 0.5s poll (still under the 90/s limit)
 
-POLL_INTERVAL_SECONDS = 0.5   # Aggressive polling (82 req/s < 90/s limit)
+POLL_INTERVAL_SECONDS = 0.5   # Aggressive polling (worst case 76 req/s < 90/s limit)
 SCANNER_INTERVAL_SECONDS = 60  # How often to scan for new events
 HEARTBEAT_INTERVAL = 30  # Heartbeat log interval
 PRE_MARKET_HOURS = 48  # How many hours ahead to scan for events
@@ -3,14 +3,17 @@ Event Scanner - Discovers Bitcoin Up/Down events from Gamma API.
 Generates dynamic slugs based on current time (same pattern as working simulator).
 """
 
+import asyncio
+import heapq
 import logging
 import time
+from functools import lru_cache
 from datetime import datetime, timezone, timedelta
-from typing import List, Optional, Dict
-import json
+from typing import List, Optional, Dict, Tuple
+from zoneinfo import ZoneInfo
 
-import requests
-import pytz
+import httpx
+import orjson
 
 from config import GAMMA_API, PRE_MARKET_HOURS
 from models import EventContext, MarketPhase
@@ -18,55 +21,73 @@ from models import EventContext, MarketPhase
 logger = logging.getLogger(__name__)
 
 # Eastern timezone for Polymarket events
-ET = pytz.timezone('America/New_York')
+ET = ZoneInfo("America/New_York")
 
 # Event duration (1 hour = 3600 seconds)
 EVENT_DURATION = 3600
 
-# Month names for slug generation
-MONTH_NAMES = {
-    1: "january", 2: "february", 3: "march", 4: "april",
-    5: "may", 6: "june", 7: "july", 8: "august",
-    9: "september", 10: "october", 11: "november", 12: "december"
-}
+# How long a slug with no Gamma event is skipped before being probed again
+MISSING_SLUG_TTL = 300
 
+# Month names for slug generation (indexed by month number, 1-12)
+MONTH_NAMES = (
+    "", "january", "february", "march", "april",
+    "may", "june", "july", "august",
+    "september", "october", "november", "december"
+)
 
+# 24h hour -> (12h hour, am/pm) for slug generation
+HOUR_12_AMPM = tuple(
+    (12 if h % 12 == 0 else h % 12, "am" if h < 12 else "pm")
+    for h in range(24)
+)
+
+
+@lru_cache(maxsize=1024)
 def generate_slug(timestamp: int) -> str:
     """
     Generate event slug from timestamp.
     
     Format: bitcoin-up-or-down-{month}-{day}-{hour}(am/pm)-et
     Example: bitcoin-up-or-down-january-23-6pm-et
+    
+    Pure function of the timestamp, so results are memoized across scans.
     """
     dt_utc = datetime.fromtimestamp(timestamp, tz=timezone.utc)
     dt_et = dt_utc.astimezone(ET)
     
     month = MONTH_NAMES[dt_et.month]
-    day = dt_et.day
-    hour = dt_et.hour
+    hour_12, am_pm = HOUR_12_AMPM[dt_et.hour]
     
-    # Convert to 12-hour format
-    if hour == 0:
-        hour_12 = 12
-        am_pm = "am"
-    elif hour < 12:
-        hour_12 = hour
-        am_pm = "am"
-    elif hour == 12:
-        hour_12 = 12
-        am_pm = "pm"
-    else:
-        hour_12 = hour - 12
-        am_pm = "pm"
+    return f"bitcoin-up-or-down-{month}-{dt_et.day}-{hour_12}{am_pm}-et"
+
+
+def _parse_clob_token_ids(clob_tokens) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Extract (yes_token_id, no_token_id) from a market's clobTokenIds.
     
-    return f"bitcoin-up-or-down-{month}-{day}-{hour_12}{am_pm}-et"
+    Gamma has no field selector and encodes this field as a JSON string inside
+    the JSON body, so it is decoded here once; an already-decoded list is used as is.
+    """
+    if isinstance(clob_tokens, str):
+        try:
+            clob_tokens = orjson.loads(clob_tokens)
+        except orjson.JSONDecodeError:
+            return None, None
+    if isinstance(clob_tokens, list) and len(clob_tokens) >= 2:
+        return clob_tokens[0], clob_tokens[1]
+    return None, None
 
 
-def get_current_hour_timestamp() -> int:
-    """Get timestamp of the current hour in ET."""
-    now = datetime.now(ET)
-    hour_start = now.replace(minute=0, second=0, microsecond=0)
-    return int(hour_start.timestamp())
+def get_current_hour_timestamp(now: Optional[float] = None) -> int:
+    """
+    Get timestamp of the start of the current hour.
+    
+    ET offsets are whole hours, so the ET hour boundary is the UTC one.
+    """
+    if now is None:
+        now = time.time()
+    return int(now) // EVENT_DURATION * EVENT_DURATION
 
 
 class EventScanner:
@@ -80,26 +101,49 @@ class EventScanner:
         self._active_events: Dict[str, EventContext] = {}
         # Track known slugs separately to avoid duplicates without limiting scan
         self._known_slugs: set = set()
-        self._session = requests.Session()
-        self._session.headers.update({
-            "Accept": "application/json",
-            "User-Agent": "ProductionBot/1.0"
-        })
+        # Min-heap of (start_timestamp, slug) for PRE_MARKET events still waiting to go LIVE
+        self._pending_transitions: List[Tuple[float, str]] = []
+        # slug -> expiry time for slugs Gamma recently reported as not existing
+        self._missing: Dict[str, float] = {}
+        # HTTP/2 lets all slug probes of a scan multiplex over one TLS connection
+        self._session = httpx.AsyncClient(
+            http2=True,
+            timeout=15,
+            headers={
+                "Accept": "application/json",
+                "User-Agent": "ProductionBot/1.0"
+            },
+            limits=httpx.Limits(max_keepalive_connections=8)
+        )
     
-    def scan_for_events(self) -> List[EventContext]:
+    async def close(self) -> None:
+        """Close the underlying HTTP client."""
+        await self._session.aclose()
+    
+    async def scan_for_events(self, now: Optional[float] = None) -> List[EventContext]:
         """
         Scan for active Bitcoin Up/Down events by generating slugs dynamically.
         Scans up to PRE_MARKET_HOURS ahead (configurable, default 48).
         
+        Args:
+            now: Current unix time snapshot (defaults to time.time())
+        
         Returns:
             List of newly discovered events
         """
+        if now is None:
+            now = time.time()
         new_events = []
-        current_ts = get_current_hour_timestamp()
+        current_ts = get_current_hour_timestamp(now)
         
         # Scan current hour + PRE_MARKET_HOURS ahead (e.g., 48 hours)
         hours_to_scan = min(PRE_MARKET_HOURS, 48)
         
+        # Drop expired "missing" entries so those slugs get probed again
+        if self._missing:
+            self._missing = {s: exp for s, exp in self._missing.items() if exp > now}
+        
+        candidates = []
         for i in range(hours_to_scan):
             ts = current_ts + (i * EVENT_DURATION)
             slug = generate_slug(ts)
@@ -108,41 +152,53 @@ class EventScanner:
             if slug in self._known_slugs:
                 continue
             
-            # Try to fetch this event
-            event = self._fetch_event_by_slug(slug, ts)
+            # Skip if Gamma had no event for it a few minutes ago
+            if slug in self._missing:
+                continue
+            candidates.append((slug, ts))
+        
+        # Fetch all unknown slugs concurrently (one round-trip window instead of N)
+        results = await asyncio.gather(
+            *[self._fetch_event_by_slug(slug, ts, now) for slug, ts in candidates]
+        )
+        
+        for (slug, ts), event in zip(candidates, results):
             if event:
                 self._known_slugs.add(slug)
                 self._active_events[slug] = event
+                if event.phase == MarketPhase.PRE_MARKET:
+                    heapq.heappush(self._pending_transitions, (event.start_timestamp, slug))
                 new_events.append(event)
                 logger.info(f"🔍 New event discovered: {slug}")
         
         # Cleanup old events (ended more than 5 min ago)
-        self._cleanup_ended_events()
+        self._cleanup_ended_events(now)
         
         return new_events
     
-    def _fetch_event_by_slug(self, slug: str, timestamp: int) -> Optional[EventContext]:
+    async def _fetch_event_by_slug(self, slug: str, timestamp: int, now: float) -> Optional[EventContext]:
         """Fetch event data from Gamma API using specific slug."""
         try:
             url = f"{GAMMA_API}/events"
             params = {"slug": slug}
             
-            response = self._session.get(url, params=params, timeout=15)
+            response = await self._session.get(url, params=params)
             response.raise_for_status()
-            events = response.json()
+            events = orjson.loads(response.content)
             
             if not events:
                 logger.debug(f"⚠️  No event found: {slug}")
+                self._missing[slug] = now + MISSING_SLUG_TTL
                 return None
             
             event_data = events[0]
-            return self._parse_event(event_data, slug, timestamp)
+            return self._parse_event(event_data, slug, timestamp, now)
             
         except Exception as e:
             logger.error(f"❌ Fetch error for {slug}: {e}")
             return None
     
-    def _parse_event(self, data: Dict, slug: str, timestamp: int) -> Optional[EventContext]:
+    def _parse_event(self, data: Dict, slug: str, timestamp: int, now: float) -> Optional[EventContext]:
         """Parse event data from Gamma API."""
         try:
             # Get markets (YES/NO tokens)
@@ -154,28 +210,14 @@ class EventScanner:
             condition_id = market.get("conditionId", "")
             
             # Extract token IDs
-            clob_tokens = market.get("clobTokenIds", "")
-            yes_token_id = None
-            no_token_id = None
-            
-            if isinstance(clob_tokens, str):
-                try:
-                    tokens = json.loads(clob_tokens)
-                    if len(tokens) >= 2:
-                        yes_token_id = tokens[0]
-                        no_token_id = tokens[1]
-                except json.JSONDecodeError:
-                    pass
-            elif isinstance(clob_tokens, list) and len(clob_tokens) >= 2:
-                yes_token_id = clob_tokens[0]
-                no_token_id = clob_tokens[1]
+            yes_token_id, no_token_id = _parse_clob_token_ids(market.get("clobTokenIds"))
             
             if not condition_id or not yes_token_id or not no_token_id:
                 logger.warning(f"⚠️  Incomplete data for {slug}")
                 return None
             
             # Determine phase
-            if time.time() >= timestamp:
+            if now >= timestamp:
                 phase = MarketPhase.LIVE
             else:
                 phase = MarketPhase.PRE_MARKET
@@ -198,15 +240,13 @@ class EventScanner:
             logger.error(f"❌ Parse error: {e}")
             return None
     
-    def _cleanup_ended_events(self) -> None:
+    def _cleanup_ended_events(self, now: float) -> None:
         """Remove events that ended more than 5 minutes ago."""
-        import time as t
-        current_time = t.time()
         ended_slugs = []
         
         for slug, context in self._active_events.items():
             # Event ended more than 5 minutes ago (1 hour duration + 300 seconds buffer)
-            if current_time > context.start_timestamp + EVENT_DURATION + 300:
+            if now > context.start_timestamp + EVENT_DURATION + 300:
                 ended_slugs.append(slug)
         
         for slug in ended_slugs:
@@ -224,28 +264,37 @@ class EventScanner:
             del self._active_events[slug]
             logger.info(f"🗑️ Event removed: {slug}")
     
-    def update_phases(self) -> List[EventContext]:
+    def update_phases(self, now: Optional[float] = None) -> List[EventContext]:
         """
         Update phases for all events.
-        Returns events that transitioned to LIVE OR are about to (within 2 seconds).
+        Returns events that transitioned to LIVE OR are about to (within 1 second).
         This allows pre-emptive order cancellation.
+        
+        Events go LIVE exactly once, in start-time order, so only the head of
+        the pending-transition heap is inspected (no per-event scan every poll).
+        
+        Args:
+            now: Current unix time snapshot shared by the whole poll cycle
         """
+        if now is None:
+            now = time.time()
         transitioned = []
+        heap = self._pending_transitions
         
-        for event in self._active_events.values():
-            old_phase = event.phase
+        while heap and heap[0][0] - now <= 1.0:
+            start_timestamp, slug = heapq.heappop(heap)
+            event = self._active_events.get(slug)
+            if event is None or event.phase != MarketPhase.PRE_MARKET:
+                continue  # Removed/cleaned up or already LIVE
+            
+            time_until = start_timestamp - now
+            event.phase = MarketPhase.LIVE
+            transitioned.append(event)
             
-            # Check if about to go LIVE (within 1 second) - pre-emptive cancellation
-            time_until = event.time_until_start()
-            if old_phase == MarketPhase.PRE_MARKET and 0 < time_until <= 1.0:
-                # Mark as LIVE early for pre-emptive cancellation
-                event.phase = MarketPhase.LIVE
-                transitioned.append(event)
+            if time_until > 0:
+                # About to go LIVE (within 1 second) - pre-emptive cancellation
                 logger.info(f"⚡ PRE-EMPTIVE: Cancelling orders {time_until:.1f}s before LIVE: {event.slug}")
             else:
-                event.update_phase()
-                if old_phase == MarketPhase.PRE_MARKET and event.phase == MarketPhase.LIVE:
-                    transitioned.append(event)
-                    logger.info(f"🔴 Event went LIVE: {event.slug}")
+                logger.info(f"🔴 Event went LIVE: {event.slug}")
         
         return transitioned
@@ -9,6 +9,8 @@ import os
 import sys
 import time
 import traceback
+from operator import attrgetter
+from typing import Optional
 
 from aiohttp import web
 
@@ -16,10 +18,6 @@ from config import (
     LOG_LEVEL, POLL_INTERVAL_SECONDS, SCANNER_INTERVAL_SECONDS,
     HEARTBEAT_INTERVAL, MAX_CONCURRENT_EVENTS
 )
-from polymarket_client import get_client
-from event_scanner import EventScanner
-from strategy_engine import StrategyEngine
-from telegram_notifier import get_notifier
 from models import MarketPhase
 
 # Configure logging
@@ -37,6 +35,22 @@ logging.getLogger("httpcore").setLevel(logging.WARNING)
 logging.getLogger("urllib3").setLevel(logging.WARNING)
 
 
+_bid_price = attrgetter("price")
+
+
+def _best_bid(order_book):
+    """
+    Highest bid price in an order book, or None if there are no bids.
+    
+    Bids may NOT be sorted, so scan them once. CLOB prices are fixed-format
+    decimal strings ("0.48") that order correctly as strings, so only the
+    winning level is converted to float.
+    """
+    if not order_book or not order_book.bids:
+        return None
+    return float(max(order_book.bids, key=_bid_price).price)
+
+
 class ProductionBot:
     """
     Main bot orchestrator.
@@ -44,11 +58,22 @@ class ProductionBot:
     """
     
     def __init__(self):
+        # Heavy trading deps (py_clob_client/web3, httpx, ...) are imported here, not at
+        # module load, so the health server's socket is bound before the import cost is paid.
+        # (They still run on the event loop: /health answers once they finish.)
+        from polymarket_client import get_client
+        from event_scanner import EventScanner
+        from strategy_engine import StrategyEngine
+        from telegram_notifier import get_notifier
+        
+        self._strategy_cls = StrategyEngine
         self.client = get_client()
         self.scanner = EventScanner(max_events=MAX_CONCURRENT_EVENTS)
-        self.strategy: StrategyEngine = None
+        self.strategy: Optional[StrategyEngine] = None
         self.notifier = get_notifier()
         self._running = False
+        # Set when the user channel pushes a fill - cuts the sleep between cycles short
+        self._wakeup: Optional[asyncio.Event] = None
     
     async def start(self) -> bool:
         """Initialize and start the bot."""
@@ -63,7 +88,7 @@ class ProductionBot:
             return False
         
         # Initialize strategy
-        self.strategy = StrategyEngine(self.client)
+        self.strategy = self._strategy_cls(self.client)
         
         # Get and log balance
         balance = self.client.get_balance()
@@ -79,10 +104,14 @@ class ProductionBot:
         """Gracefully stop the bot."""
         logger.info("🛑 Stopping bot...")
         self._running = False
+        self.client.set_fill_listener(None)
         
         # Cancel all open orders for safety
         cancelled = self.client.cancel_all_orders()
         logger.info(f"❌ Cancelled {cancelled} orders on shutdown")
+        
+        self.client.close()
+        await self.scanner.close()
     
     async def run(self):
         """Main bot loop."""
@@ -91,15 +120,24 @@ class ProductionBot:
         
         last_scan = 0
         last_heartbeat = 0
+        # Fixed-rate schedule: each cycle starts POLL_INTERVAL_SECONDS after the previous one
+        next_tick = time.monotonic()
+        
+        # React to fills as they are pushed instead of at the next tick
+        loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        self.client.set_fill_listener(lambda: loop.call_soon_threadsafe(self._wakeup.set))
         
         try:
             while self._running:
+                # Fills pushed from here on wake the sleep at the end of this cycle
+                self._wakeup.clear()
                 now = time.time()
                 
                 # Scan for new events periodically
                 if now - last_scan >= SCANNER_INTERVAL_SECONDS:
                     last_scan = now
-                    new_events = self.scanner.scan_for_events()
+                    new_events = await self.scanner.scan_for_events(now)
                     
                     for event in new_events:
                         self.notifier.send_event_discovered(event)
@@ -114,38 +152,44 @@ class ProductionBot:
                                 f"⚠️ SKIPPING event {event.slug} - already in {event.phase.name} phase. "
                                 f"No orders placed to avoid losses."
                             )
+                    
+                    # Scanning takes a while - refresh the snapshot for this cycle
+                    now = time.time()
                 
                 # Update phases and handle transitions
-                transitioned = self.scanner.update_phases()
+                transitioned = self.scanner.update_phases(now)
                 for event in transitioned:
                     self.strategy.transition_to_live(event)
                 
                 # ====================================================
-                # OPTIMIZATION: Fetch open orders ONCE per cycle
+                # OPTIMIZATION: Open order IDs ONCE per cycle (live set, WS-maintained)
+                # ====================================================
+                global_open_ids = self.client.get_open_order_ids()
+                
+                # ====================================================
+                # OPTIMIZATION: Fetch ALL order books in ONE request
                 # ====================================================
-                all_open_orders = self.client.get_open_orders()
-                global_open_ids = {o.get("id") for o in all_open_orders}
+                active_events = self.scanner.get_active_events()
+                books = self.client.get_order_books(
+                    [t for e in active_events for t in (e.yes_token_id, e.no_token_id)]
+                )
+                
+                # Order changes pushed since last cycle (limits check_fills lookups)
+                self.strategy.begin_cycle()
                 
                 # Check fills for active events
-                for event in self.scanner.get_active_events():
+                for event in active_events:
                     # 🔍 UPDATE LIVE PRICES (for Stop-Loss)
                     try:
-                        # Fetch YES Orderbook
-                        yes_ob = self.client._client.get_order_book(event.yes_token_id)
-                        if yes_ob and yes_ob.bids:
-                            # Find the HIGHEST bid (best exit price)
-                            # Bids may NOT be sorted, so find max
-                            best_yes_bid = max(float(b.price) for b in yes_ob.bids)
-                            # Sanity check: ignore spam bids below 10¢
-                            if best_yes_bid >= 0.10:
-                                event.yes_bid = best_yes_bid
+                        # Find the HIGHEST bid (best exit price)
+                        # Sanity check: ignore spam bids below 10¢
+                        best_yes_bid = _best_bid(books.get(event.yes_token_id))
+                        if best_yes_bid is not None and best_yes_bid >= 0.10:
+                            event.yes_bid = best_yes_bid
                         
-                        # Fetch NO Orderbook
-                        no_ob = self.client._client.get_order_book(event.no_token_id)
-                        if no_ob and no_ob.bids:
-                            best_no_bid = max(float(b.price) for b in no_ob.bids)
-                            if best_no_bid >= 0.10:
-                                event.no_bid = best_no_bid
+                        best_no_bid = _best_bid(books.get(event.no_token_id))
+                        if best_no_bid is not None and best_no_bid >= 0.10:
+                            event.no_bid = best_no_bid
                             
                     except Exception as e:
                         logger.warning(f"⚠️ Failed to update prices for {event.slug}: {e}")
@@ -163,9 +207,22 @@ class ProductionBot:
                 # Heartbeat
                 if now - last_heartbeat >= HEARTBEAT_INTERVAL:
                     last_heartbeat = now
-                    self._log_heartbeat()
+                    self._log_heartbeat(now)
                 
-                await asyncio.sleep(POLL_INTERVAL_SECONDS)
+                # Sleep until the next tick (work time is NOT added to the period)
+                # or until a fill is pushed, whichever comes first
+                next_tick += POLL_INTERVAL_SECONDS
+                delay = next_tick - time.monotonic()
+                if delay < 0:
+                    logger.warning(f"⏱️ Loop overrun by {-delay:.3f}s")
+                    next_tick = time.monotonic()
+                    await asyncio.sleep(0)  # Still yield, or the health server and wakeups starve
+                else:
+                    try:
+                        await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                        next_tick = time.monotonic()  # Woken early: restart the schedule from now
+                    except asyncio.TimeoutError:
+                        pass
                 
         except asyncio.CancelledError:
             logger.info("🛑 Bot cancelled")
@@ -176,15 +233,15 @@ class ProductionBot:
         finally:
             await self.stop()
     
-    def _log_heartbeat(self):
+    def _log_heartbeat(self, now: float):
         """Log status heartbeat."""
         events = self.scanner.get_active_events()
         pending = self.strategy.get_pending_count() if self.strategy else 0
         
         if events:
             # Find next event to go LIVE
-            next_live = min(events, key=lambda e: e.time_until_start())
-            time_left = next_live.time_until_start()
+            next_live = min(events, key=lambda e: e.start_timestamp)
+            time_left = next_live.time_until_start(now)
             
             if time_left > 0:
                 mins = int(time_left / 60)
@@ -253,7 +310,6 @@ async def main():
         await bot.run()
     except Exception as e:
         logger.error(f"❌ Bot error: {e}")
-        import traceback
         logger.error(traceback.format_exc())
         # Keep health server running even if bot fails
         await asyncio.sleep(60)  # Give time to see logs
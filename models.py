@@ -39,7 +39,7 @@ class StrategyState(Enum):
     COMPLETED = "completed"        # All positions closed
 
 
-@dataclass
+@dataclass(slots=True)
 class EventContext:
     """
     Represents a discovered Polymarket event.
@@ -56,23 +56,23 @@ class EventContext:
     yes_bid: Optional[float] = None
     no_bid: Optional[float] = None
     
-    def time_until_start(self) -> float:
+    def time_until_start(self, now: Optional[float] = None) -> float:
         """Seconds until event starts (negative if started)."""
-        return self.start_timestamp - time.time()
+        return self.start_timestamp - (time.time() if now is None else now)
     
-    def has_started(self) -> bool:
+    def has_started(self, now: Optional[float] = None) -> bool:
         """Check if event has started."""
-        return time.time() >= self.start_timestamp
+        return (time.time() if now is None else now) >= self.start_timestamp
     
-    def update_phase(self) -> None:
+    def update_phase(self, now: Optional[float] = None) -> None:
         """Update phase based on current time."""
-        if not self.has_started():
+        if not self.has_started(now):
             self.phase = MarketPhase.PRE_MARKET
         else:
             self.phase = MarketPhase.LIVE
 
 
-@dataclass
+@dataclass(slots=True)
 class TrackedOrder:
     """
     An order we placed and are tracking.
@@ -88,12 +88,18 @@ class TrackedOrder:
     
     # For matching entry to exit
     entry_price: Optional[float] = None  # Set on sell orders to track original buy
+    entry_cents: int = 0  # entry_price in integer cents - what entries are matched on
+    needs_sl: bool = False  # Entry is a stop-loss level (set together with entry_price)
     
     # Track how much of this order we have already processed (accumulated/sold)
     processed_size: float = 0.0
+    
+    # Consecutive API failures while polling / verifying this order
+    api_fail_count: int = 0
+    verify_fail_count: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     """
     An open position (filled buy, pending exit).
@@ -103,10 +109,11 @@ class Position:
     size: float
     token_id: str
     event_slug: str
+    entry_cents: int = 0  # entry_price in integer cents
     entry_time: float = field(default_factory=time.time)
 
 
-@dataclass
+@dataclass(slots=True)
 class CycleResult:
     """
     Results from a complete trading cycle for one event.
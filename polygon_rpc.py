@@ -0,0 +1,102 @@
+"""
+Polygon RPC - Shared connection helpers for the on-chain scripts.
+Races every POLYGON_RPCS endpoint and keeps the first healthy one.
+"""
+
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from web3 import Web3
+
+from config import (
+    POLYGON_RPCS, MULTICALL3_ADDRESS, USDC_ADDRESS,
+    CONDITIONAL_TOKENS_ADDRESS, EXCHANGE_CONTRACTS
+)
+
+# Probes run concurrently, so a short timeout only bounds the all-dead case
+PROBE_TIMEOUT = 3
+
+# Timeout for regular calls on the selected endpoint
+RPC_TIMEOUT = 10
+
+MULTICALL3_ABI = [
+    {"inputs": [{"name": "requireSuccess", "type": "bool"}, {"components": [{"name": "target", "type": "address"}, {"name": "callData", "type": "bytes"}], "name": "calls", "type": "tuple[]"}], "name": "tryAggregate", "outputs": [{"components": [{"name": "success", "type": "bool"}, {"name": "returnData", "type": "bytes"}], "name": "returnData", "type": "tuple[]"}], "stateMutability": "payable", "type": "function"}
+]
+MULTICALL3_CHECKSUM = Web3.to_checksum_address(MULTICALL3_ADDRESS)
+
+# Checksummed once at import (to_checksum_address keccak-hashes every address)
+USDC_CHECKSUM = Web3.to_checksum_address(USDC_ADDRESS)
+CONDITIONAL_TOKENS_CHECKSUM = Web3.to_checksum_address(CONDITIONAL_TOKENS_ADDRESS)
+EXCHANGES_CHECKSUM = tuple(Web3.to_checksum_address(a) for a in EXCHANGE_CONTRACTS)
+
+# Shared keep-alive session so every RPC call reuses the same TCP/TLS connection.
+# Dropped/refused connections are retried on the pooled adapter instead of failing the call.
+RPC_SESSION = requests.Session()
+RPC_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=len(POLYGON_RPCS),
+    pool_maxsize=32,
+    pool_block=False,
+    max_retries=Retry(total=3, backoff_factor=0.3)
+))
+
+
+def _probe_rpc(rpc):
+    """Return rpc if it answers within PROBE_TIMEOUT, or raise."""
+    w3 = Web3(Web3.HTTPProvider(rpc, request_kwargs={'timeout': PROBE_TIMEOUT}, session=RPC_SESSION))
+    if not w3.is_connected():
+        raise ConnectionError("not connected")
+    return rpc
+
+
+def connect_fastest_rpc():
+    """
+    Race every POLYGON_RPCS endpoint in parallel and keep the first one that answers.
+    Bounded by the fastest healthy RPC instead of the sum of slow/failed timeouts.
+    
+    Returns:
+        Web3 instance (RPC_TIMEOUT per call) on the winning endpoint, or None
+    """
+    executor = ThreadPoolExecutor(max_workers=len(POLYGON_RPCS))
+    pending = {executor.submit(_probe_rpc, rpc): rpc for rpc in POLYGON_RPCS}
+    print(f"🔌 Racing {len(pending)} RPC endpoints...")
+    try:
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                rpc = pending.pop(future)
+                try:
+                    future.result()
+                except Exception as e:
+                    print(f"  ❌ {rpc} failed: {e}")
+                    continue
+                print(f"✅ Connected via {rpc}")
+                return Web3(Web3.HTTPProvider(rpc, request_kwargs={'timeout': RPC_TIMEOUT}, session=RPC_SESSION))
+        return None
+    finally:
+        # Don't wait for the slower probes
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def multicall_calldata(w3, calls):
+    """
+    Encode several read-only calls as ONE Multicall3.tryAggregate call (to MULTICALL3_CHECKSUM).
+    
+    Args:
+        calls: List of (checksummed target address, calldata)
+    """
+    multicall = w3.eth.contract(address=MULTICALL3_CHECKSUM, abi=MULTICALL3_ABI)
+    return multicall.functions.tryAggregate(False, calls)._encode_transaction_data()
+
+
+def decode_multicall(w3, raw):
+    """Raw return data (bytes) per call, in order; None for calls that reverted."""
+    results = w3.codec.decode(['(bool,bytes)[]'], raw)[0]
+    return [data if success and data else None for success, data in results]
+
+
+def multicall_read(w3, calls):
+    """Run several read-only calls as ONE eth_call through Multicall3.tryAggregate."""
+    raw = w3.eth.call({'to': MULTICALL3_CHECKSUM, 'data': multicall_calldata(w3, calls)})
+    return decode_multicall(w3, raw)
@@ -4,13 +4,28 @@ Handles all order placement and status checking.
 """
 
 import logging
-from typing import Optional, List, Dict, Any
+import random
+import threading
+import time
+import traceback
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache, partial
+from itertools import islice
+from typing import Optional, List, Dict, Any, Set, Tuple, Callable
 
+import httpx
+import orjson
 from py_clob_client.client import ClobClient
-from py_clob_client.clob_types import OrderArgs, OrderType as ClobOrderType, BalanceAllowanceParams, AssetType
+from py_clob_client.http_helpers import helpers as clob_http
+from py_clob_client.order_builder import builder as clob_order_builder
+from py_clob_client.clob_types import (
+    OrderArgs, OrderType as ClobOrderType, BalanceAllowanceParams, AssetType, BookParams, PostOrdersArgs,
+    OrderBookSummary, OrderSummary
+)
 from py_clob_client.order_builder.constants import BUY, SELL
 
-import time as time_module
+from clob_stream import ClobStream
 
 from config import (
     CLOB_HOST, CHAIN_ID,
@@ -21,6 +36,110 @@ from models import OrderSide, OrderType, TrackedOrder
 
 logger = logging.getLogger(__name__)
 
+# Fire-and-forget cancels arriving within this window go out in ONE batch request
+CANCEL_COALESCE_SECONDS = 0.01
+
+# Full REST re-read of open orders at least this often, even with the WS feed healthy
+OPEN_ORDERS_RESYNC_SECONDS = 30
+
+# Most recent trades kept in memory (fed by the user channel)
+TRADE_RING_SIZE = 1000
+
+# Max orders per POST /orders request (CLOB limit)
+MAX_BATCH_ORDERS = 15
+
+# Our order type -> py-clob-client side constant
+_SIDE_MAP: Dict[OrderType, str] = {OrderType.BUY: BUY, OrderType.SELL: SELL}
+
+# (token_id, side, order_type, price, size, event_slug) - same as place_limit_order args
+OrderSpec = Tuple[str, OrderSide, OrderType, float, float, str]
+
+
+class _OrjsonResponse(httpx.Response):
+    """httpx response whose .json() decodes with orjson."""
+    
+    def json(self, **kwargs: Any) -> Any:
+        return orjson.loads(self.content)
+
+
+class _OrjsonClient(httpx.Client):
+    """
+    httpx client handing out _OrjsonResponse objects.
+    py-clob-client parses every REST reply with resp.json() - books and order
+    lists are the largest payloads of each poll.
+    """
+    
+    def send(self, request: httpx.Request, **kwargs: Any) -> httpx.Response:
+        response = super().send(request, **kwargs)
+        response.__class__ = _OrjsonResponse
+        return response
+
+
+def _cache_order_builders() -> None:
+    """
+    py-clob-client creates a new py_order_utils signer (key -> account derivation) and
+    OrderBuilder (EIP-712 domain separator hash) for EVERY order. Both depend only on
+    (key) and (exchange, chain_id, signer), so memoize the constructors: each order
+    then only hashes and signs its own struct.
+    """
+    if not (hasattr(clob_order_builder, "UtilsSigner") and hasattr(clob_order_builder, "UtilsOrderBuilder")):
+        logger.warning("⚠️ Unknown py-clob-client order builder layout; order signing not cached")
+        return
+    
+    # Signer first: cached signers are the same object, so the builder cache key hits
+    clob_order_builder.UtilsSigner = lru_cache(maxsize=4)(clob_order_builder.UtilsSigner)
+    clob_order_builder.UtilsOrderBuilder = lru_cache(maxsize=8)(clob_order_builder.UtilsOrderBuilder)
+
+
+_cache_order_builders()
+
+
+def _install_http_pool() -> None:
+    """
+    Route every py-clob-client request through one tuned keep-alive HTTP/2 pool.
+    py-clob-client sends all REST calls through a module-level httpx client;
+    replacing it keeps connections (and TLS sessions) alive between polls.
+    """
+    if not hasattr(clob_http, "_http_client"):
+        logger.warning("⚠️ py-clob-client has no shared HTTP client; using its default transport")
+        return
+    
+    clob_http._http_client = _OrjsonClient(
+        transport=httpx.HTTPTransport(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=32,
+                max_keepalive_connections=16,
+                keepalive_expiry=30
+            ),
+            # Re-dial on connect errors/timeouts only - nothing was sent yet, so POSTs are safe
+            retries=2
+        )
+    )
+
+
+_install_http_pool()
+
+
+def _retry_delay(attempt: int) -> float:
+    """Linear SELL retry back-off plus up to 50% jitter (de-syncs retries across tokens)."""
+    base = SELL_RETRY_DELAY * (attempt + 1)
+    return base + random.uniform(0, base / 2)
+
+
+def _warm_connection() -> None:
+    """Open the pooled connection to CLOB_HOST (DNS + TLS) before the first real request."""
+    try:
+        clob_http._http_client.head(CLOB_HOST, timeout=2)
+    except Exception as e:
+        logger.debug(f"Connection warm-up failed (harmless): {e}")
+
+
+@lru_cache(maxsize=256)
+def _conditional_params(token_id: str) -> BalanceAllowanceParams:
+    """Balance query params for one outcome token (reused across calls)."""
+    return BalanceAllowanceParams(asset_type=AssetType.CONDITIONAL, token_id=token_id)
+
 
 class PolymarketClient:
     """
@@ -28,10 +147,65 @@ class PolymarketClient:
     KISS: One method per action.
     """
     
+    __slots__ = (
+        "_client", "_connected", "_signature_type", "_pool",
+        "_user_stream", "_order_cache", "_cache_lock", "_trades", "_trades_seeded",
+        "_dirty_orders", "_dirty_overflow", "_fill_listener",
+        "_open_orders", "_open_order_ids", "_last_sync_ts", "_closed_during_sync",
+        "_inflight", "_inflight_lock",
+        "_pending_cancels", "_cancel_timer", "_cancel_lock",
+        "_market_stream", "_book_assets", "_books", "_book_lock",
+    )
+    
+    # Reused for every collateral balance query. get_balance_allowance() fills in
+    # signature_type on first use - always the same value for this client.
+    _COLLATERAL_PARAMS = BalanceAllowanceParams(asset_type=AssetType.COLLATERAL)
+    
     def __init__(self):
         self._client: Optional[ClobClient] = None
         self._connected = False
         self._signature_type = 2  # 2 for Polymarket proxy wallets (browser login)
+        # Fan-out pool for per-order status lookups (see get_orders_batch)
+        self._pool = ThreadPoolExecutor(max_workers=16, thread_name_prefix="clob-get")
+        
+        # Order status pushed by the user WebSocket channel (order_id -> REST-shaped dict)
+        self._user_stream: Optional[ClobStream] = None
+        self._order_cache: Dict[str, Dict[str, Any]] = {}
+        self._cache_lock = threading.Lock()
+        
+        # Recent trades, newest first; seeded from REST after each (re)subscription
+        self._trades: deque = deque(maxlen=TRADE_RING_SIZE)
+        self._trades_seeded = False
+        
+        # Order IDs the user channel reported changed since the last drain_order_updates().
+        # Overflow = updates may have been missed (reconnect) - callers must re-check everything.
+        self._dirty_orders: set = set()
+        self._dirty_overflow = True
+        # Called (from the stream thread) when the user channel reports a fill
+        self._fill_listener: Optional[Callable[[], None]] = None
+        
+        # Open orders (order_id -> order), REST snapshot kept current by the user channel
+        self._open_orders: Dict[str, Dict[str, Any]] = {}
+        # Same IDs as a long-lived set, updated in place (see get_open_order_ids)
+        self._open_order_ids: Set[str] = set()
+        self._last_sync_ts = 0.0
+        # IDs closed by the WS while a REST snapshot is in flight (None when not syncing)
+        self._closed_during_sync: Optional[set] = None
+        
+        # In-flight REST lookups shared by concurrent callers (see _single_flight)
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+        
+        # Cancels waiting for the coalescing timer (see schedule_cancel)
+        self._pending_cancels: set = set()
+        self._cancel_timer: Optional[threading.Timer] = None
+        self._cancel_lock = threading.Lock()
+        
+        # Order books pushed by the market channel: token_id -> (bids, asks), each {price: size}
+        self._market_stream: Optional[ClobStream] = None
+        self._book_assets: frozenset = frozenset()
+        self._books: Dict[str, Tuple[Dict[str, str], Dict[str, str]]] = {}
+        self._book_lock = threading.Lock()
     
     def connect(self) -> bool:
         """
@@ -65,13 +239,16 @@ class PolymarketClient:
             
             # Set API credentials using derive
             logger.info("🔑 Setting API credentials...")
-            self._client.set_api_creds(self._client.create_or_derive_api_creds())
+            creds = self._client.create_or_derive_api_creds()
+            self._client.set_api_creds(creds)
             logger.info("✅ API credentials configured")
             
-            # Test connection by fetching balance
+            # Test connection by fetching balance (also warms the pooled TLS connection).
+            # The open-orders snapshot is independent - fetch it at the same time.
             logger.info("💰 Testing connection (fetching balance)...")
-            balance_params = BalanceAllowanceParams(asset_type=AssetType.COLLATERAL)
-            result = self._client.get_balance_allowance(params=balance_params)
+            orders_future = self._pool.submit(self._sync_open_orders)
+            result = self._client.get_balance_allowance(params=self._COLLATERAL_PARAMS)
+            orders_future.result()
             
             # Balance is in micro-units (1e6)
             balance_raw = int(result.get("balance", 0))
@@ -80,11 +257,13 @@ class PolymarketClient:
             
             self._connected = True
             logger.info("✅ Connected to Polymarket CLOB")
+            
+            # Order status is pushed over the user channel; REST is the fallback
+            self._start_user_stream(creds)
             return True
             
         except Exception as e:
             logger.error(f"❌ Connection failed: {e}")
-            import traceback
             logger.error(traceback.format_exc())
             return False
     
@@ -92,6 +271,226 @@ class PolymarketClient:
     def is_connected(self) -> bool:
         return self._connected and self._client is not None
     
+    def close(self) -> None:
+        """Stop background streams."""
+        if self._user_stream:
+            self._user_stream.stop()
+        if self._market_stream:
+            self._market_stream.stop()
+    
+    # =========================================================================
+    # USER CHANNEL (WebSocket push of our own order updates)
+    # =========================================================================
+    
+    def _start_user_stream(self, creds) -> None:
+        """Subscribe to the authenticated user channel."""
+        self._user_stream = ClobStream(
+            channel="user",
+            subscription={
+                "auth": {
+                    "apiKey": creds.api_key,
+                    "secret": creds.api_secret,
+                    "passphrase": creds.api_passphrase,
+                },
+                "type": "user",
+            },
+            on_event=self._handle_user_event,
+            on_connect=self._reset_order_cache
+        )
+        self._user_stream.start()
+    
+    def _reset_order_cache(self) -> None:
+        """Updates may have been missed while disconnected - start from REST again."""
+        with self._cache_lock:
+            self._order_cache.clear()
+            self._last_sync_ts = 0.0  # Force a REST open-orders resync
+            self._trades.clear()
+            self._trades_seeded = False
+            self._dirty_orders.clear()
+            self._dirty_overflow = True
+    
+    def _handle_user_event(self, event: Dict[str, Any]) -> None:
+        event_type = event.get("event_type")
+        if event_type == "order":
+            self._handle_order_update(event)
+        elif event_type == "trade":
+            self._handle_trade_update(event)
+    
+    def _handle_trade_update(self, data: Dict[str, Any]) -> None:
+        """Record a new trade. Later status updates (MINED/CONFIRMED) of the same trade are ignored."""
+        if data.get("status") != "MATCHED":
+            return
+        with self._cache_lock:
+            self._trades.appendleft(data)
+    
+    def _handle_order_update(self, data: Dict[str, Any]) -> None:
+        """
+        Merge a PLACEMENT / UPDATE / CANCELLATION event into the order cache.
+        Entries keep the REST get_order() shape (status LIVE / MATCHED / CANCELED).
+        """
+        order_id = data.get("id")
+        if not order_id:
+            return
+        
+        if data.get("type") == "CANCELLATION":
+            status = "CANCELED"
+        else:
+            size_matched = float(data.get("size_matched") or 0)
+            original_size = float(data.get("original_size") or 0)
+            status = "MATCHED" if original_size and size_matched >= original_size else "LIVE"
+        
+        with self._cache_lock:
+            # Replace (never mutate) so readers holding the old dict are unaffected
+            entry = dict(self._order_cache.get(order_id, ()))
+            entry.update(data)
+            entry["status"] = status
+            self._order_cache[order_id] = entry
+            self._dirty_orders.add(order_id)
+            
+            if status == "LIVE":
+                self._open_orders[order_id] = entry
+                self._open_order_ids.add(order_id)
+            else:
+                self._open_orders.pop(order_id, None)
+                self._open_order_ids.discard(order_id)
+                if self._closed_during_sync is not None:
+                    self._closed_during_sync.add(order_id)
+        
+        # UPDATE = the order (partially) matched
+        listener = self._fill_listener
+        if listener is not None and data.get("type") == "UPDATE":
+            listener()
+    
+    def set_fill_listener(self, listener: Optional[Callable[[], None]]) -> None:
+        """
+        Register a callback for fills pushed by the user channel (None to remove).
+        It runs on the stream thread, so it must be quick and thread-safe.
+        """
+        self._fill_listener = listener
+    
+    def drain_order_updates(self) -> Optional[set]:
+        """
+        Order IDs with a user-channel update since the last call.
+        
+        Returns:
+            Set of order IDs, or None if updates may have been missed
+            (stream down or reconnected) and every order must be re-checked
+        """
+        if self._user_stream is None or not self._user_stream.is_healthy:
+            return None
+        
+        with self._cache_lock:
+            if self._dirty_overflow:
+                self._dirty_overflow = False
+                self._dirty_orders.clear()
+                return None
+            updated, self._dirty_orders = self._dirty_orders, set()
+        return updated
+    
+    def _single_flight(self, key: str, fetch: Callable[[], Any]) -> Any:
+        """
+        Run fetch() once for all concurrent callers asking for the same key.
+        The first caller does the request; the others wait for and share its result.
+        """
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                self._inflight[key] = future
+        
+        if not is_owner:
+            return future.result()
+        
+        try:
+            result = fetch()
+            future.set_result(result)
+            return result
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+    
+    # =========================================================================
+    # MARKET CHANNEL (WebSocket push of order books for the tokens we watch)
+    # =========================================================================
+    
+    def _watch_books(self, token_ids: List[str]) -> None:
+        """(Re)subscribe the market channel when the watched token set changes."""
+        assets = frozenset(token_ids)
+        if assets == self._book_assets:
+            return
+        
+        if self._market_stream:
+            self._market_stream.stop()
+        with self._book_lock:
+            self._book_assets = assets
+            self._books.clear()
+        
+        self._market_stream = ClobStream(
+            channel="market",
+            subscription={"assets_ids": sorted(assets), "type": "market"},
+            on_event=self._handle_market_event,
+            on_connect=self._reset_books
+        )
+        self._market_stream.start()
+    
+    def _reset_books(self) -> None:
+        """Fresh "book" snapshots follow every subscription."""
+        with self._book_lock:
+            self._books.clear()
+    
+    def _handle_market_event(self, event: Dict[str, Any]) -> None:
+        event_type = event.get("event_type")
+        
+        if event_type == "book":
+            # Full snapshot for one token
+            asset_id = event.get("asset_id")
+            if asset_id not in self._book_assets:
+                return  # Late event from a previous subscription
+            bids = {level["price"]: level["size"] for level in event.get("bids") or event.get("buys") or ()}
+            asks = {level["price"]: level["size"] for level in event.get("asks") or event.get("sells") or ()}
+            with self._book_lock:
+                self._books[asset_id] = (bids, asks)
+        
+        elif event_type == "price_change":
+            # Level updates; size "0" removes the level
+            changes = event.get("price_changes")
+            if changes is None:
+                # Older format: one asset per message
+                changes = [dict(c, asset_id=event.get("asset_id")) for c in event.get("changes", ())]
+            
+            with self._book_lock:
+                for change in changes:
+                    book = self._books.get(change.get("asset_id"))
+                    if book is None:
+                        continue  # No snapshot yet
+                    levels = book[0] if change.get("side") == "BUY" else book[1]
+                    if float(change["size"]) == 0:
+                        levels.pop(change["price"], None)
+                    else:
+                        levels[change["price"]] = change["size"]
+    
+    def _cached_books(self, token_ids: List[str]) -> Dict[str, Any]:
+        """Cached books as OrderBookSummary (same shape as REST); missing tokens omitted."""
+        if self._market_stream is None or not self._market_stream.is_healthy:
+            return {}
+        
+        books = {}
+        with self._book_lock:
+            for token_id in token_ids:
+                book = self._books.get(token_id)
+                if book is None:
+                    continue
+                books[token_id] = OrderBookSummary(
+                    asset_id=token_id,
+                    bids=[OrderSummary(price=p, size=sz) for p, sz in book[0].items()],
+                    asks=[OrderSummary(price=p, size=sz) for p, sz in book[1].items()]
+                )
+        return books
+    
     def place_limit_order(
         self,
         token_id: str,
@@ -123,35 +522,143 @@ class PolymarketClient:
         # SELL orders are critical - retry on failure
         max_attempts = SELL_RETRY_ATTEMPTS if order_type == OrderType.SELL else 1
         
+        # Sign ONCE: a retry re-posts the same signed order, so an attempt that reached
+        # the exchange but lost its response can't turn into a second order
+        try:
+            signed_order = self._build_order(token_id, order_type, price, size)
+        except Exception as e:
+            logger.error(f"❌ Order signing failed: {e}")
+            return None
+        
         for attempt in range(max_attempts):
             try:
-                # Map to py-clob-client types
-                clob_side = BUY if order_type == OrderType.BUY else SELL
-                
-                order_args = OrderArgs(
-                    price=price,
-                    size=size,
-                    side=clob_side,
-                    token_id=token_id
-                )
-                
-                # Create and post the order
-                signed_order = self._client.create_order(order_args)
                 response = self._client.post_order(signed_order, ClobOrderType.GTC)
-                
+                tracked = self._track_response(response, token_id, side, order_type, price, size, event_slug, attempt, max_attempts)
+                if tracked:
+                    return tracked
+            except Exception as e:
+                logger.error(f"❌ Order error (attempt {attempt+1}/{max_attempts}): {e}")
+            
+            # Retry SELL orders after brief (jittered) delay
+            if order_type == OrderType.SELL and attempt < max_attempts - 1:
+                time.sleep(_retry_delay(attempt))
+                continue
+            return None
+        
+        return None
+    
+    def _build_order(self, token_id: str, order_type: OrderType, price: float, size: float):
+        """Create and sign (EIP-712) a limit order."""
+        return self._client.create_order(OrderArgs(
+            price=price,
+            size=size,
+            side=_SIDE_MAP[order_type],
+            token_id=token_id
+        ))
+    
+    def _track_response(
+        self,
+        response: Dict[str, Any],
+        token_id: str,
+        side: OrderSide,
+        order_type: OrderType,
+        price: float,
+        size: float,
+        event_slug: str,
+        attempt: int,
+        max_attempts: int
+    ) -> Optional[TrackedOrder]:
+        """Turn a post_order response into a TrackedOrder (None + error log if rejected)."""
+        order_id = response.get("orderID", "")
+        
+        if not order_id:
+            error_msg = response.get("error", response.get("message", str(response)))
+            logger.error(f"❌ Order failed (attempt {attempt+1}/{max_attempts}): {error_msg}")
+            return None
+        
+        logger.info(
+            "📝 Order placed: %s %s @ %d¢ x%s | ID: %.8s...",
+            order_type.value, side.display_name, price * 100, size, order_id
+        )
+        
+        return TrackedOrder(
+            order_id=order_id,
+            token_id=token_id,
+            side=side,
+            order_type=order_type,
+            price=price,
+            size=size,
+            event_slug=event_slug
+        )
+    
+    def place_limit_orders_batch(self, specs: List[OrderSpec]) -> List[Optional[TrackedOrder]]:
+        """
+        Place several limit orders with one POST /orders per MAX_BATCH_ORDERS.
+        Each order is still signed individually (EIP-712); only the HTTP round-trip is shared.
+        Orders the batch endpoint rejects are NOT retried here.
+        
+        Args:
+            specs: List of (token_id, side, order_type, price, size, event_slug)
+            
+        Returns:
+            TrackedOrder (or None if it failed) for each spec, in the same order
+        """
+        if not self.is_connected:
+            logger.error("❌ Not connected")
+            return [None] * len(specs)
+        
+        if not specs:
+            return []
+        
+        if not hasattr(self._client, "post_orders"):
+            # Old py-clob-client without the batch endpoint
+            return [self.place_limit_order(*spec) for spec in specs]
+        
+        results: List[Optional[TrackedOrder]] = []
+        
+        for start in range(0, len(specs), MAX_BATCH_ORDERS):
+            chunk = specs[start:start + MAX_BATCH_ORDERS]
+            
+            try:
+                batch = [
+                    PostOrdersArgs(
+                        order=self._build_order(token_id, order_type, price, size),
+                        orderType=ClobOrderType.GTC
+                    )
+                    for token_id, side, order_type, price, size, event_slug in chunk
+                ]
+            except Exception as e:
+                # Nothing was sent yet - placing them one by one is safe
+                logger.error(f"❌ Batch signing error: {e}. Falling back to single orders...")
+                results.extend(self.place_limit_order(*spec) for spec in chunk)
+                continue
+            
+            responses = self._post_signed_batch(batch)
+            if responses is None:
+                # Outcome unknown: the server may have accepted the batch. Never
+                # re-sign (that would be a second, distinct copy of every order).
+                logger.error(
+                    f"❌ Batch post failed twice - {len(chunk)} order(s) may or may not be live. "
+                    f"Not re-signing; open orders will show what was placed."
+                )
+                results.extend([None] * len(chunk))
+                continue
+            
+            for spec, response in zip(chunk, responses):
+                token_id, side, order_type, price, size, event_slug = spec
                 order_id = response.get("orderID", "")
                 
                 if not order_id:
-                    error_msg = response.get("error", response.get("message", str(response)))
-                    logger.error(f"❌ Order failed (attempt {attempt+1}/{max_attempts}): {error_msg}")
-                    
-                    # Retry SELL orders after brief delay
-                    if order_type == OrderType.SELL and attempt < max_attempts - 1:
-                        time_module.sleep(SELL_RETRY_DELAY * (attempt + 1))
-                        continue
-                    return None
+                    error_msg = response.get("errorMsg") or response.get("error") or str(response)
+                    logger.error(f"❌ Order failed (batch): {order_type.value} {side.display_name} @ {int(price*100)}¢: {error_msg}")
+                    results.append(None)
+                    continue
                 
-                tracked = TrackedOrder(
+                logger.info(
+                    "📝 Order placed: %s %s @ %d¢ x%s | ID: %.8s...",
+                    order_type.value, side.display_name, price * 100, size, order_id
+                )
+                results.append(TrackedOrder(
                     order_id=order_id,
                     token_id=token_id,
                     side=side,
@@ -159,24 +666,31 @@ class PolymarketClient:
                     price=price,
                     size=size,
                     event_slug=event_slug
-                )
-                
-                logger.info(
-                    f"📝 Order placed: {order_type.value} {side.display_name} "
-                    f"@ {int(price*100)}¢ x{size} | ID: {order_id[:8]}..."
-                )
-                
-                return tracked
-                
-            except Exception as e:
-                logger.error(f"❌ Order error (attempt {attempt+1}/{max_attempts}): {e}")
-                
-                # Retry SELL orders after brief delay
-                if order_type == OrderType.SELL and attempt < max_attempts - 1:
-                    time_module.sleep(SELL_RETRY_DELAY * (attempt + 1))
-                    continue
-                return None
+                ))
+            
+            # Response shorter than the request: treat missing entries as failed
+            results.extend([None] * (len(chunk) - len(responses)))
         
+        return results
+    
+    def _post_signed_batch(self, batch: List[Any]) -> Optional[List[Dict[str, Any]]]:
+        """
+        POST already-signed orders, re-posting the SAME signed orders once on failure
+        (an identical signed order is deduplicated by the CLOB, a new signature is not).
+        
+        Returns:
+            The response list, or None if the outcome is unknown
+        """
+        for attempt in range(2):
+            try:
+                responses = self._client.post_orders(batch)
+                if isinstance(responses, list):
+                    return responses
+                logger.error(f"❌ Unexpected batch response (attempt {attempt+1}/2): {responses}")
+            except Exception as e:
+                logger.error(f"❌ Batch post error (attempt {attempt+1}/2): {e}")
+            if attempt == 0:
+                time.sleep(_retry_delay(attempt))
         return None
     
     def cancel_order(self, order_id: str) -> bool:
@@ -194,12 +708,33 @@ class PolymarketClient:
         
         try:
             self._client.cancel(order_id)
-            logger.info(f"❌ Order cancelled: {order_id[:8]}...")
+            logger.info("❌ Order cancelled: %.8s...", order_id)
             return True
         except Exception as e:
             logger.error(f"❌ Cancel failed: {e}")
             return False
     
+    def schedule_cancel(self, order_id: str) -> None:
+        """
+        Queue a cancel that doesn't need confirmation.
+        Cancels queued within CANCEL_COALESCE_SECONDS are sent together via cancel_orders_batch.
+        """
+        with self._cancel_lock:
+            self._pending_cancels.add(order_id)
+            if self._cancel_timer is None:
+                self._cancel_timer = threading.Timer(CANCEL_COALESCE_SECONDS, self._flush_cancels)
+                self._cancel_timer.daemon = True
+                self._cancel_timer.start()
+    
+    def _flush_cancels(self) -> None:
+        with self._cancel_lock:
+            order_ids = list(self._pending_cancels)
+            self._pending_cancels.clear()
+            self._cancel_timer = None
+        
+        if order_ids:
+            self.cancel_orders_batch(order_ids)
+    
     def cancel_all_orders(self) -> int:
         """
         Cancel all open orders.
@@ -219,7 +754,7 @@ class PolymarketClient:
             logger.error(f"❌ Cancel all failed: {e}")
             return 0
     
-    def cancel_orders_batch(self, order_ids: List[str]) -> int:
+    def cancel_orders_batch(self, order_ids: List[str]) -> List[str]:
         """
         Cancel multiple orders at once (faster than individual cancels).
         
@@ -227,29 +762,26 @@ class PolymarketClient:
             order_ids: List of order IDs to cancel
             
         Returns:
-            Number of orders cancelled
+            IDs of the orders that were cancelled
         """
         if not self.is_connected or not order_ids:
-            return 0
+            return []
         
         try:
             # Use cancel_orders batch endpoint
             response = self._client.cancel_orders(order_ids)
             cancelled = response.get("canceled", [])
-            logger.info(f"❌ Batch cancelled {len(cancelled)}/{len(order_ids)} orders")
-            return len(cancelled)
+            logger.info("❌ Batch cancelled %d/%d orders", len(cancelled), len(order_ids))
+            return cancelled
         except Exception as e:
             logger.error(f"❌ Batch cancel failed: {e}")
             # Fallback to individual cancels
-            cancelled = 0
-            for order_id in order_ids:
-                if self.cancel_order(order_id):
-                    cancelled += 1
-            return cancelled
+            return [order_id for order_id in order_ids if self.cancel_order(order_id)]
     
     def get_open_orders(self) -> List[Dict[str, Any]]:
         """
         Get all open orders.
+        Uses the WebSocket-maintained snapshot when possible, REST otherwise.
         
         Returns:
             List of order dictionaries
@@ -257,30 +789,123 @@ class PolymarketClient:
         if not self.is_connected:
             return []
         
+        # Served from memory while the user channel is live (REST resync every 30s)
+        if (
+            self._user_stream is not None and self._user_stream.is_healthy
+            and time.time() - self._last_sync_ts < OPEN_ORDERS_RESYNC_SECONDS
+        ):
+            with self._cache_lock:
+                return list(self._open_orders.values())
+        
+        return self._sync_open_orders()
+    
+    def get_open_order_ids(self) -> Set[str]:
+        """
+        IDs of all open orders, without building a new set every call.
+        
+        Returns the client's live set (kept current by the user channel, REST
+        resync as in get_open_orders). Use it for membership checks only - it
+        changes under the caller as WS updates arrive.
+        """
+        if not self.is_connected:
+            return set()
+        
+        if not (
+            self._user_stream is not None and self._user_stream.is_healthy
+            and time.time() - self._last_sync_ts < OPEN_ORDERS_RESYNC_SECONDS
+        ):
+            self._sync_open_orders()
+        return self._open_order_ids
+    
+    def _sync_open_orders(self) -> List[Dict[str, Any]]:
+        """Fetch open orders from REST and replace the in-memory snapshot."""
+        with self._cache_lock:
+            self._closed_during_sync = set()
+        
         try:
-            orders = self._client.get_orders()
-            return orders if orders else []
+            orders = self._client.get_orders() or []
         except Exception as e:
             logger.error(f"❌ Get orders failed: {e}")
+            with self._cache_lock:
+                self._closed_during_sync = None
             return []
+        
+        with self._cache_lock:
+            # Don't resurrect orders the WS reported closed while REST was answering
+            closed = self._closed_during_sync
+            self._closed_during_sync = None
+            self._open_orders = {o.get("id"): o for o in orders if o.get("id") not in closed}
+            self._open_order_ids.clear()
+            self._open_order_ids.update(self._open_orders)
+            self._last_sync_ts = time.time()
+            # Drop cached orders that are no longer open and already drained, so the
+            # cache holds open orders plus recent closes instead of the whole session
+            # (a later lookup of an evicted ID just goes to REST)
+            stale = [
+                oid for oid in self._order_cache
+                if oid not in self._open_orders and oid not in self._dirty_orders
+            ]
+            for oid in stale:
+                del self._order_cache[oid]
+            return list(self._open_orders.values())
 
-    def get_order(self, order_id: str) -> Dict[str, Any]:
+    def get_order(self, order_id: str, fresh: bool = False) -> Dict[str, Any]:
         """
         Get a single order by ID.
+        Uses the WebSocket-fed cache when possible, REST otherwise.
+        
+        Args:
+            fresh: Always ask REST and overwrite the cached entry (reconcile
+                passes - catches an update the user channel never delivered)
         """
         if not self.is_connected:
             return {}
         
+        # Served from the user channel while it is live
+        if not fresh and self._user_stream is not None and self._user_stream.is_healthy:
+            with self._cache_lock:
+                cached = self._order_cache.get(order_id)
+            if cached is not None:
+                return cached
+        
         try:
-            return self._client.get_order(order_id)
+            order = self._single_flight(f"order:{order_id}", lambda: self._client.get_order(order_id))
+            if order:
+                # Seed the cache; WS updates from here on keep it current
+                with self._cache_lock:
+                    if fresh:
+                        self._order_cache[order_id] = order
+                    else:
+                        self._order_cache.setdefault(order_id, order)
+            return order
         except Exception as e:
             # Log as debug - this is a transient API error that gets retried automatically
-            logger.debug(f"⏳ Get order {order_id[:8]}... failed (will retry): {e}")
+            logger.debug("⏳ Get order %.8s... failed (will retry): %s", order_id, e)
             return {}
     
+    def get_orders_batch(self, order_ids: List[str], fresh: bool = False) -> Dict[str, Dict[str, Any]]:
+        """
+        Get several orders by ID concurrently.
+        
+        The CLOB has no multi-ID order endpoint, so lookups fan out over a
+        thread pool instead of running back-to-back.
+        
+        Args:
+            fresh: Bypass the WS cache (see get_order)
+        
+        Returns:
+            Dict of order_id -> order data ({} if that lookup failed)
+        """
+        if not order_ids:
+            return {}
+        
+        fetch = partial(self.get_order, fresh=fresh)
+        return dict(zip(order_ids, self._pool.map(fetch, order_ids)))
+    
     def get_trades(self, limit: int = 50) -> List[Dict[str, Any]]:
         """
-        Get recent trades (fills).
+        Get recent trades (fills), newest first.
+        Uses the WebSocket-fed ring buffer when possible, REST otherwise.
         
         Returns:
             List of trade dictionaries
@@ -288,28 +913,43 @@ class PolymarketClient:
         if not self.is_connected:
             return []
         
+        # Served from the ring buffer while the user channel is live
+        if self._user_stream is not None and self._user_stream.is_healthy and self._trades_seeded:
+            with self._cache_lock:
+                return list(islice(self._trades, limit))
+        
         try:
-            trades = self._client.get_trades()
-            return trades[:limit] if trades else []
+            trades = self._client.get_trades() or []
+            with self._cache_lock:
+                # REST history is newest first, like the ring
+                self._trades.clear()
+                self._trades.extend(islice(trades, TRADE_RING_SIZE))
+                self._trades_seeded = True
+            return trades[:limit]
         except Exception as e:
             logger.error(f"❌ Get trades failed: {e}")
             return []
 
-    def get_balance(self) -> float:
+    def get_balance_micro(self) -> int:
         """
-        Get current USDC collateral balance.
+        Get current USDC collateral balance in micro-units (1 USDC = 1_000_000).
+        Exact integer - use this for comparisons against order costs.
         """
         if not self.is_connected:
-            return 0.0
+            return 0
             
         try:
-            balance_params = BalanceAllowanceParams(asset_type=AssetType.COLLATERAL)
-            result = self._client.get_balance_allowance(params=balance_params)
-            balance_raw = int(result.get("balance", 0))
-            return balance_raw / 1_000_000
+            result = self._client.get_balance_allowance(params=self._COLLATERAL_PARAMS)
+            return int(result.get("balance", 0))
         except Exception as e:
             logger.error(f"❌ Get balance failed: {e}")
-            return 0.0
+            return 0
+    
+    def get_balance(self) -> float:
+        """
+        Get current USDC collateral balance (for display/notifications).
+        """
+        return self.get_balance_micro() / 1_000_000
 
     def get_token_balance(self, token_id: str) -> float:
         """
@@ -321,11 +961,7 @@ class PolymarketClient:
             
         try:
             # AssetType.CONDITIONAL is for specific outcome tokens
-            balance_params = BalanceAllowanceParams(
-                asset_type=AssetType.CONDITIONAL,
-                token_id=token_id
-            )
-            result = self._client.get_balance_allowance(params=balance_params)
+            result = self._client.get_balance_allowance(params=_conditional_params(token_id))
             
             # Balance is in micro-units (1e6)
             balance_raw = int(result.get("balance", 0))
@@ -344,11 +980,43 @@ class PolymarketClient:
         if not self.is_connected:
             return None
         
+        cached = self._cached_books([token_id])
+        if cached:
+            return cached[token_id]
+        
         try:
-            return self._client.get_order_book(token_id)
+            return self._single_flight(f"book:{token_id}", lambda: self._client.get_order_book(token_id))
         except Exception as e:
             logger.error(f"❌ Get order book failed: {e}")
             return None
+    
+    def get_order_books(self, token_ids: List[str]) -> Dict[str, Any]:
+        """
+        Get order books for several tokens.
+        Served from the market WebSocket channel; any token without a streamed
+        snapshot yet is fetched in ONE request (POST /books).
+        
+        Returns:
+            Dict of token_id -> order book (missing tokens are omitted)
+        """
+        if not self.is_connected or not token_ids:
+            return {}
+        
+        # Books for these tokens are pushed over the market channel from now on
+        self._watch_books(token_ids)
+        books = self._cached_books(token_ids)
+        
+        # REST only for tokens without a streamed snapshot (startup / reconnect)
+        missing = [t for t in token_ids if t not in books]
+        if not missing:
+            return books
+        
+        try:
+            fetched = self._client.get_order_books([BookParams(token_id=t) for t in missing])
+            books.update((book.asset_id, book) for book in fetched or [])
+        except Exception as e:
+            logger.error(f"❌ Get order books failed: {e}")
+        return books
 
 
 # Singleton instance
@@ -360,4 +1028,6 @@ def get_client() -> PolymarketClient:
     global _client
     if _client is None:
         _client = PolymarketClient()
+        # Handshake in the background while the caller keeps starting up
+        threading.Thread(target=_warm_connection, name="clob-warmup", daemon=True).start()
     return _client
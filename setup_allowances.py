@@ -9,48 +9,25 @@ This approves:
 After running this successfully, the bot can operate 24/7 unattended.
 """
 
+import argparse
+import json
 import os
 import time
-from dotenv import load_dotenv
+
 from web3 import Web3
 from eth_account import Account
 
-load_dotenv()
-
-# Polygon RPC endpoints (try multiple)
-POLYGON_RPCS = [
-    "https://polygon.llamarpc.com",
-    "https://polygon-rpc.com",
-    "https://rpc-mainnet.maticvigil.com",
-    "https://polygon-mainnet.public.blastapi.io",
-]
-
-# Contract addresses (Polygon Mainnet)
-USDC_ADDRESS = "0x2791Bca1f2de4661ED88A30C99A7a9449Aa84174"
-CONDITIONAL_TOKENS_ADDRESS = "0x4D97DCd97eC945f40cF65F87097ACe5EA0476045"
-
-# Exchange contracts to approve
-EXCHANGE_CONTRACTS = [
-    "0x4bFb41d5B3570DeFd03C39a9A4D8dE6Bd8B8982E",  # Main exchange (CTF)
-    "0xC5d563A36AE78145C45a50134d48A1215220f80a",  # Neg risk exchange
-    "0xd91E80cF2E7be2e162c6513ceD06f1dD0dA35296",  # Neg risk adapter
-]
-
-# Maximum approval amount
-MAX_UINT256 = 2**256 - 1
+from config import (
+    PRIVATE_KEY, EXCHANGE_CONTRACTS, MAX_UINT256
+)
+from polygon_rpc import (
+    connect_fastest_rpc, multicall_calldata, decode_multicall,
+    MULTICALL3_CHECKSUM, USDC_CHECKSUM, CONDITIONAL_TOKENS_CHECKSUM,
+    EXCHANGES_CHECKSUM, RPC_SESSION, RPC_TIMEOUT
+)
 
-# ERC20 ABI (only approve function needed)
+# ERC20 ABI (allowance check only - approve() calldata is pre-encoded below)
 ERC20_ABI = [
-    {
-        "constant": False,
-        "inputs": [
-            {"name": "spender", "type": "address"},
-            {"name": "amount", "type": "uint256"}
-        ],
-        "name": "approve",
-        "outputs": [{"name": "", "type": "bool"}],
-        "type": "function"
-    },
     {
         "constant": True,
         "inputs": [
@@ -63,18 +40,8 @@ ERC20_ABI = [
     }
 ]
 
-# ERC1155 ABI (for Conditional Tokens - setApprovalForAll)
+# ERC1155 ABI (for Conditional Tokens - isApprovedForAll check only)
 ERC1155_ABI = [
-    {
-        "constant": False,
-        "inputs": [
-            {"name": "operator", "type": "address"},
-            {"name": "approved", "type": "bool"}
-        ],
-        "name": "setApprovalForAll",
-        "outputs": [],
-        "type": "function"
-    },
     {
         "constant": True,
         "inputs": [
@@ -87,11 +54,204 @@ ERC1155_ABI = [
     }
 ]
 
+# Gas amounts in wei, as plain ints (to_wei goes through Decimal)
+PRIORITY_FEE_WEI = 30 * 10**9  # 30 gwei - Polygon validators' minimum tip
+MIN_MATIC_WEI = 10**16         # 0.01 MATIC - warn below this
+
+# ==========================================================================
+# Pre-encoded approval calldata: selector + spender word + constant argument.
+# Only the spender changes per exchange, so no ABI encoding at send time.
+# ==========================================================================
+APPROVE_SELECTOR = bytes.fromhex("095ea7b3")               # approve(address,uint256)
+SET_APPROVAL_FOR_ALL_SELECTOR = bytes.fromhex("a22cb465")  # setApprovalForAll(address,bool)
+MAX_UINT256_WORD = MAX_UINT256.to_bytes(32, "big")
+TRUE_WORD = (1).to_bytes(32, "big")
+
+
+def _address_word(address):
+    """Left-pad a 0x address to a 32-byte ABI word."""
+    return bytes.fromhex(address[2:].lower().zfill(64))
+
+
+USDC_APPROVE_CALLDATA = tuple(
+    APPROVE_SELECTOR + _address_word(a) + MAX_UINT256_WORD for a in EXCHANGE_CONTRACTS
+)
+CT_APPROVE_CALLDATA = tuple(
+    SET_APPROVAL_FOR_ALL_SELECTOR + _address_word(a) + TRUE_WORD for a in EXCHANGE_CONTRACTS
+)
+
+
+def _post_batch(rpc_url, batch):
+    """
+    POST one JSON-RPC batch and return the response item per request, in order ({} if missing).
+    
+    Args:
+        batch: List of (method, params)
+    """
+    payload = [
+        {"jsonrpc": "2.0", "id": i, "method": method, "params": params}
+        for i, (method, params) in enumerate(batch)
+    ]
+    response = RPC_SESSION.post(rpc_url, json=payload, timeout=RPC_TIMEOUT)
+    response.raise_for_status()
+    
+    items = response.json()
+    if not isinstance(items, list):
+        raise ValueError(f"RPC rejected batch request: {items}")
+    
+    by_id = {item.get("id"): item for item in items}
+    return [by_id.get(i, {}) for i in range(len(batch))]
+
 
-def setup_allowances():
-    """Set up all necessary allowances for Polymarket trading."""
+def batch_rpc(rpc_url, method, params_list):
+    """
+    Run the same JSON-RPC method for several params lists in ONE batch request.
     
-    private_key = os.getenv("PRIVATE_KEY", "")
+    Returns:
+        Raw "result" per request, in order; None for requests that errored
+    """
+    items = _post_batch(rpc_url, [(method, params) for params in params_list])
+    return [item.get("result") for item in items]
+
+
+def build_signed(to, data, private_key, nonce, max_fee, priority_fee):
+    """Sign an EIP-1559 (type 2) approval transaction from raw calldata with an explicit nonce."""
+    tx = {
+        'to': to,
+        'data': data,
+        'value': 0,
+        'nonce': nonce,
+        'gas': 100000,  # Limit only - unused gas is not charged
+        'maxFeePerGas': max_fee,
+        'maxPriorityFeePerGas': priority_fee,
+        'type': 2,
+        'chainId': 137
+    }
+    return Account.sign_transaction(tx, private_key)
+
+
+# Errors that mean "slow down", not "this transaction is bad"
+RATE_LIMIT_MARKERS = ("429", "rate limit", "too many requests")
+SEND_MAX_ATTEMPTS = 4
+
+
+def send_with_backoff(rpc_url, raw_txs):
+    """
+    Broadcast signed transactions in ONE eth_sendRawTransaction batch, backing off
+    only when the RPC rate-limits us. Sleeps min(2**attempt, 8)s between attempts;
+    any other error is raised immediately.
+    
+    Returns:
+        JSON-RPC response item per transaction, in order ("result" = tx hash, or "error")
+    """
+    batch = [("eth_sendRawTransaction", [Web3.to_hex(raw_tx)]) for raw_tx in raw_txs]
+    for attempt in range(SEND_MAX_ATTEMPTS):
+        try:
+            return _post_batch(rpc_url, batch)
+        except Exception as e:
+            message = str(e).lower()
+            if attempt == SEND_MAX_ATTEMPTS - 1 or not any(m in message for m in RATE_LIMIT_MARKERS):
+                raise
+            delay = min(2 ** attempt, 8)
+            print(f"  ⏳ RPC rate limit, retrying in {delay}s...")
+            time.sleep(delay)
+
+
+def _hash_key(tx_hash):
+    """Normalize a tx hash (HexBytes or hex string) for comparisons."""
+    return tx_hash.lower() if isinstance(tx_hash, str) else Web3.to_hex(tx_hash)
+
+
+def wait_for_receipts(w3, tx_hashes, start_block, timeout=120, poll_interval=2):
+    """
+    Wait for several transactions by scanning whole blocks with eth_getBlockReceipts.
+    One RPC per new block instead of one eth_getTransactionReceipt per tx per poll.
+    
+    Falls back to per-tx receipt lookups if the RPC does not support eth_getBlockReceipts.
+    
+    Returns:
+        Dict of normalized tx hash -> receipt for every tx mined before the deadline
+    """
+    pending = {_hash_key(h): h for h in tx_hashes}
+    receipts = {}
+    next_block = start_block + 1
+    block_receipts_supported = True
+    deadline = time.monotonic() + timeout
+    
+    while pending and time.monotonic() < deadline:
+        if block_receipts_supported:
+            latest = w3.eth.block_number
+            while pending and next_block <= latest:
+                try:
+                    block = w3.manager.request_blocking("eth_getBlockReceipts", [hex(next_block)])
+                except Exception as e:
+                    print(f"  ⚠️  eth_getBlockReceipts unavailable ({e}), polling per transaction")
+                    block_receipts_supported = False
+                    break
+                for receipt in block or []:
+                    key = _hash_key(receipt['transactionHash'])
+                    if key in pending:
+                        del pending[key]
+                        receipts[key] = receipt
+                next_block += 1
+        else:
+            for key, tx_hash in list(pending.items()):
+                try:
+                    receipt = w3.eth.get_transaction_receipt(tx_hash)
+                except Exception:
+                    continue  # Not mined yet
+                del pending[key]
+                receipts[key] = receipt
+        
+        if pending:
+            time.sleep(poll_interval)
+    
+    return receipts
+
+
+def _receipt_ok(receipt):
+    """True if the receipt reports success (status may be raw hex from eth_getBlockReceipts)."""
+    if receipt is None:
+        return False
+    status = receipt['status']
+    return (int(status, 16) if isinstance(status, str) else status) == 1
+
+
+def _allowance_cache_path(address):
+    return os.path.expanduser(f"~/.polymarket_allowances_{address}.json")
+
+
+def load_allowance_cache(address):
+    """Approvals already confirmed for this wallet: {"usdc:<exchange>": True, "ct:<exchange>": True, ...}"""
+    try:
+        with open(_allowance_cache_path(address)) as f:
+            cache = json.load(f)
+        return cache if isinstance(cache, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def save_allowance_cache(address, cache):
+    """Write the cache atomically (temp file + os.replace) so a crash never leaves it half-written."""
+    path = _allowance_cache_path(address)
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, "w") as f:
+            json.dump(cache, f, indent=2)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"⚠️  Could not save allowance cache: {e}")
+
+
+def setup_allowances(force=False):
+    """
+    Set up all necessary allowances for Polymarket trading.
+    
+    Approvals confirmed by a previous run are read from a local cache and not
+    re-checked on-chain unless force is set.
+    """
+    
+    private_key = PRIVATE_KEY
     if not private_key:
         print("❌ PRIVATE_KEY not found in .env")
         return False
@@ -100,134 +260,178 @@ def setup_allowances():
     if not private_key.startswith("0x"):
         private_key = "0x" + private_key
     
-    # Connect to Polygon - try multiple RPCs
-    w3 = None
-    for rpc in POLYGON_RPCS:
-        print(f"🔌 Trying {rpc}...")
-        try:
-            w3 = Web3(Web3.HTTPProvider(rpc, request_kwargs={'timeout': 10}))
-            if w3.is_connected():
-                print(f"✅ Connected to Polygon (Chain ID: {w3.eth.chain_id})")
-                break
-        except Exception as e:
-            print(f"  ❌ Failed: {e}")
-            continue
-    
-    if not w3 or not w3.is_connected():
-        print("❌ Failed to connect to any Polygon RPC")
-        return False
-    
     # Get account from private key
     account = Account.from_key(private_key)
     address = account.address
     print(f"📍 Wallet address: {address}")
     
-    # Check MATIC balance for gas
-    balance = w3.eth.get_balance(address)
-    matic_balance = w3.from_wei(balance, 'ether')
-    print(f"💰 MATIC balance: {matic_balance:.4f}")
+    # Approvals are permanent (MAX_UINT256 / approved=true) - trust earlier confirmations
+    cache = {} if force else load_allowance_cache(address)
+    usdc_keys = [f"usdc:{exchange_addr}" for exchange_addr in EXCHANGES_CHECKSUM]
+    ct_keys = [f"ct:{exchange_addr}" for exchange_addr in EXCHANGES_CHECKSUM]
+    total_approvals = len(EXCHANGE_CONTRACTS) * 2  # USDC + CT for each
     
-    if balance < w3.to_wei(0.01, 'ether'):
-        print("⚠️  Warning: Low MATIC balance. You may need more for gas.")
+    if all(cache.get(key) for key in usdc_keys + ct_keys):
+        print(f"✅ All {total_approvals} approvals confirmed by a previous run (use --force to re-check)")
+        print("\n🎉 All allowances set! Your bot can now trade 24/7.")
+        return True
+    
+    # Connect to Polygon - race all RPCs, keep the fastest healthy one
+    w3 = connect_fastest_rpc()
+    if not w3:
+        print("❌ Failed to connect to any Polygon RPC")
+        return False
+    rpc_url = w3.provider.endpoint_uri
     
     # USDC contract
-    usdc = w3.eth.contract(address=Web3.to_checksum_address(USDC_ADDRESS), abi=ERC20_ABI)
+    usdc = w3.eth.contract(address=USDC_CHECKSUM, abi=ERC20_ABI)
     
     # Conditional Tokens contract
     conditional_tokens = w3.eth.contract(
-        address=Web3.to_checksum_address(CONDITIONAL_TOKENS_ADDRESS), 
+        address=CONDITIONAL_TOKENS_CHECKSUM,
         abi=ERC1155_ABI
     )
     
+    # Approvals not cached yet - checked on-chain through Multicall3
+    calls = []
+    checked_keys = []
+    for exchange_addr, usdc_key, ct_key in zip(EXCHANGES_CHECKSUM, usdc_keys, ct_keys):
+        if not cache.get(usdc_key):
+            checked_keys.append(usdc_key)
+            calls.append((usdc.address, usdc.functions.allowance(address, exchange_addr)._encode_transaction_data()))
+        if not cache.get(ct_key):
+            checked_keys.append(ct_key)
+            calls.append((conditional_tokens.address, conditional_tokens.functions.isApprovedForAll(address, exchange_addr)._encode_transaction_data()))
+    
+    # Every startup read (chain, MATIC balance, nonce, fees, allowance states) in ONE request
+    try:
+        batch_results = [
+            item.get("result") for item in _post_batch(rpc_url, [
+                ("eth_chainId", []),
+                ("eth_getBalance", [address, "latest"]),
+                ("eth_getTransactionCount", [address, "latest"]),
+                ("eth_getBlockByNumber", ["latest", False]),
+                ("eth_call", [{"to": MULTICALL3_CHECKSUM, "data": multicall_calldata(w3, calls)}, "latest"]),
+            ])
+        ]
+        if any(result is None for result in batch_results):
+            raise ValueError(f"missing results: {batch_results}")
+        chain_id, balance, nonce, latest_block, allowances = batch_results
+    except Exception as e:
+        print(f"❌ Startup reads failed: {e}")
+        return False
+    
+    print(f"✅ Connected to Polygon (Chain ID: {int(chain_id, 16)})")
+    
+    # Check MATIC balance for gas
+    balance = int(balance, 16)
+    matic_balance = w3.from_wei(balance, 'ether')
+    print(f"💰 MATIC balance: {matic_balance:.4f}")
+    
+    if balance < MIN_MATIC_WEI:
+        print("⚠️  Warning: Low MATIC balance. You may need more for gas.")
+    
     success_count = 0
-    total_approvals = len(EXCHANGE_CONTRACTS) * 2  # USDC + CT for each
     
-    for exchange in EXCHANGE_CONTRACTS:
-        exchange_addr = Web3.to_checksum_address(exchange)
-        print(f"\n🔧 Setting allowances for {exchange[:10]}...")
+    # 1. Decode the allowance states and queue the missing approvals
+    results = dict(zip(checked_keys, decode_multicall(w3, bytes.fromhex(allowances[2:]))))
+    
+    pending = []  # (label, cache key, contract address, calldata)
+    for i, exchange in enumerate(EXCHANGE_CONTRACTS):
+        print(f"\n🔍 Allowances for {exchange[:10]}...")
+        usdc_key, ct_key = usdc_keys[i], ct_keys[i]
         
-        # 1. Approve USDC
-        try:
-            current_allowance = usdc.functions.allowance(address, exchange_addr).call()
-            if current_allowance >= MAX_UINT256 // 2:
-                print(f"  ✅ USDC already approved")
-                success_count += 1
-            else:
-                print(f"  📝 Approving USDC...")
-                nonce = w3.eth.get_transaction_count(address)
-                
-                # Dynamic gas price
-                gas_price = w3.eth.gas_price
-                if gas_price < w3.to_wei(100, 'gwei'):
-                    gas_price = w3.to_wei(150, 'gwei') # Minimum safe for Polygon
-                else:
-                    gas_price = int(gas_price * 1.5) # 50% buffer
-
-                tx = usdc.functions.approve(exchange_addr, MAX_UINT256).build_transaction({
-                    'from': address,
-                    'nonce': nonce,
-                    'gas': 100000,
-                    'gasPrice': gas_price,
-                    'chainId': 137
-                })
-                signed = w3.eth.account.sign_transaction(tx, private_key)
-                tx_hash = w3.eth.send_raw_transaction(signed.raw_transaction)
-                print(f"  ⏳ Sending USDC approval ({tx_hash.hex()[:10]}...)...")
-                receipt = w3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
-                if receipt['status'] == 1:
-                    print(f"  ✅ USDC approved!")
-                    success_count += 1
-                else:
-                    print(f"  ❌ USDC approval failed")
-        except Exception as e:
-            if "already known" in str(e) or "underpriced" in str(e):
-                print(f"  ⚠️  Transaction pending or gas too low. Retrying with higher gas...")
-            else:
-                print(f"  ❌ USDC approval error: {e}")
+        if cache.get(usdc_key):
+            print(f"  ✅ USDC already approved (cached)")
+            success_count += 1
+        elif results[usdc_key] is None:
+            print(f"  ❌ USDC allowance check failed")
+        elif w3.codec.decode(['uint256'], results[usdc_key])[0] >= MAX_UINT256 // 2:
+            print(f"  ✅ USDC already approved")
+            cache[usdc_key] = True
+            success_count += 1
+        else:
+            print(f"  📝 USDC approval needed")
+            pending.append((f"USDC → {exchange[:10]}", usdc_key, USDC_CHECKSUM, USDC_APPROVE_CALLDATA[i]))
         
-        # Delay to avoid rate limiting
-        time.sleep(20)
+        if cache.get(ct_key):
+            print(f"  ✅ Conditional Tokens already approved (cached)")
+            success_count += 1
+        elif results[ct_key] is None:
+            print(f"  ❌ Conditional Tokens approval check failed")
+        elif w3.codec.decode(['bool'], results[ct_key])[0]:
+            print(f"  ✅ Conditional Tokens already approved")
+            cache[ct_key] = True
+            success_count += 1
+        else:
+            print(f"  📝 Conditional Tokens approval needed")
+            pending.append((f"Conditional Tokens → {exchange[:10]}", ct_key, CONDITIONAL_TOKENS_CHECKSUM, CT_APPROVE_CALLDATA[i]))
+    
+    save_allowance_cache(address, cache)
+    
+
+    if pending:
+        # 2. Sign with consecutive nonces and broadcast everything at once.
+        #    The chain executes them in nonce order, so there is no need to wait in between.
+        print(f"\n📝 Sending {len(pending)} approval transactions...")
+        nonce = int(nonce, 16)
+        
+        # EIP-1559 fees - read once for the whole batch.
+        # Pay base fee + tip only; 2x base fee headroom keeps txs valid if blocks fill up.
+        base_fee = int(latest_block['baseFeePerGas'], 16)
+        start_block = int(latest_block['number'], 16)  # Receipts are scanned from the next block on
+        priority_fee = PRIORITY_FEE_WEI
+        max_fee = 2 * base_fee + priority_fee
         
-        # 2. Approve Conditional Tokens
+        # Sign everything locally first (no RPC), then broadcast in ONE batch request
+        signed_txs = [
+            build_signed(to, data, private_key, nonce + i, max_fee, priority_fee)
+            for i, (_, _, to, data) in enumerate(pending)
+        ]
         try:
-            is_approved = conditional_tokens.functions.isApprovedForAll(address, exchange_addr).call()
-            if is_approved:
-                print(f"  ✅ Conditional Tokens already approved")
-                success_count += 1
+            responses = send_with_backoff(rpc_url, [signed.raw_transaction for signed in signed_txs])
+        except Exception as e:
+            print(f"❌ Broadcast failed: {e}")
+            responses = [{"error": str(e)}] * len(pending)
+        
+        sent = []  # (label, cache key, tx_hash)
+        for (label, key, _, _), signed, response in zip(pending, signed_txs, responses):
+            error = None if response.get("result") else response.get("error", "no response")
+            if error is None:
+                tx_hash = response["result"]
+                print(f"  ⏳ Sent {label} approval ({_hash_key(tx_hash)[:10]}...)")
+                sent.append((label, key, tx_hash))
+            elif "already known" in str(error) or "underpriced" in str(error):
+                print(f"  ⚠️  {label}: transaction pending or gas too low. Re-run to retry with fresh gas price.")
             else:
-                print(f"  📝 Approving Conditional Tokens...")
-                nonce = w3.eth.get_transaction_count(address)
-                
-                # Dynamic gas price
-                gas_price = w3.eth.gas_price
-                if gas_price < w3.to_wei(100, 'gwei'):
-                    gas_price = w3.to_wei(150, 'gwei')
-                else:
-                    gas_price = int(gas_price * 1.5)
-
-                tx = conditional_tokens.functions.setApprovalForAll(exchange_addr, True).build_transaction({
-                    'from': address,
-                    'nonce': nonce,
-                    'gas': 100000,
-                    'gasPrice': gas_price,
-                    'chainId': 137
-                })
-                signed = w3.eth.account.sign_transaction(tx, private_key)
-                tx_hash = w3.eth.send_raw_transaction(signed.raw_transaction)
-                print(f"  ⏳ Sending Conditional Tokens approval ({tx_hash.hex()[:10]}...)...")
-                receipt = w3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
-                if receipt['status'] == 1:
-                    print(f"  ✅ Conditional Tokens approved!")
+                print(f"  ❌ {label} approval error: {error}")
+        
+        # 3. Wait for the LAST nonce only - the chain mines a sender's txs in nonce order,
+        #    so once it is in, every earlier one is too. Their receipts are then read
+        #    in one batch just to report individual statuses.
+        if sent:
+            print(f"\n⏳ Waiting for {len(sent)} confirmations...")
+            last_hash = sent[-1][2]
+            receipts = wait_for_receipts(w3, [last_hash], start_block)
+            
+            earlier = [tx_hash for _, _, tx_hash in sent[:-1]]
+            if earlier:
+                try:
+                    results = batch_rpc(rpc_url, "eth_getTransactionReceipt", [[_hash_key(h)] for h in earlier])
+                    for tx_hash, receipt in zip(earlier, results):
+                        receipts[_hash_key(tx_hash)] = receipt
+                except Exception as e:
+                    print(f"  ⚠️  Receipt batch failed: {e}")
+            
+            for label, key, tx_hash in sent:
+                if _receipt_ok(receipts.get(_hash_key(tx_hash))):
+                    print(f"  ✅ {label} approved!")
+                    cache[key] = True
                     success_count += 1
                 else:
-                    print(f"  ❌ Conditional Tokens approval failed")
-        except Exception as e:
-            print(f"  ❌ Conditional Tokens approval error: {e}")
-        
-        # Delay between exchanges
-        if exchange != EXCHANGE_CONTRACTS[-1]:
-            print("  ⏳ Waiting 20s before next exchange...")
-            time.sleep(20)
+                    print(f"  ❌ {label} approval failed")
+            
+            save_allowance_cache(address, cache)
     
     print(f"\n{'='*50}")
     print(f"✅ Completed: {success_count}/{total_approvals} approvals")
@@ -241,6 +445,10 @@ def setup_allowances():
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Approve Polymarket contracts to use your tokens.")
+    parser.add_argument("--force", action="store_true", help="Ignore the local allowance cache and re-check on-chain")
+    args = parser.parse_args()
+    
     print("="*50)
     print("🔧 POLYMARKET ALLOWANCE SETUP")
     print("="*50)
@@ -249,6 +457,6 @@ if __name__ == "__main__":
     
     confirm = input("Continue? (y/n): ").strip().lower()
     if confirm == 'y':
-        setup_allowances()
+        setup_allowances(force=args.force)
     else:
         print("Cancelled.")
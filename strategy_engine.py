@@ -5,9 +5,9 @@ Manages ladder placement, fill tracking, and position management.
 
 import logging
 import time
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
 
-from config import LADDER_LEVELS, EXIT_PRICES, ORDER_SIZE, STOP_LOSS_PRICE, STOP_LOSS_ENTRIES, MIN_SHARES, MIN_NOTIONAL
+from config import LADDER_LEVELS, EXIT_PRICES, EXIT_PRICES_CENTS, ORDER_SIZE, STOP_LOSS_PRICE, STOP_LOSS_ENTRIES_CENTS, MIN_SHARES, MIN_NOTIONAL
 from models import (
     EventContext, OrderSide, OrderType, TrackedOrder,
     Position, CycleResult, StrategyState, MarketPhase
@@ -17,6 +17,22 @@ from telegram_notifier import get_notifier
 
 logger = logging.getLogger(__name__)
 
+# Re-check every tracked order at least this often (seconds), even with the user
+# channel reporting changes - reconciles anything the feed missed. Time-based because
+# pushed fills wake the main loop early, so cycles have no fixed length.
+FULL_RECHECK_SECONDS = 30
+
+# Order status groups (the API spells "cancelled" both ways)
+_CANCELLED_STATUSES = frozenset({"CANCELED", "CANCELLED"})
+_CLOSED_STATUSES = _CANCELLED_STATUSES | {"MATCHED"}
+_DEAD_STATUSES = _CANCELLED_STATUSES | {"INVALID", "EXPIRED", "REJECTED"}
+
+
+def _cents(price: float) -> int:
+    """Price in dollars -> integer cents (entry matching is done on these, never on floats)."""
+    # Prices are never negative: truncating +0.5 rounds like round() without the call
+    return int(price * 100 + 0.5)
+
 
 class StrategyEngine:
     """
@@ -35,23 +51,41 @@ class StrategyEngine:
         
         # State tracking per event
         self._states: Dict[str, StrategyState] = {}
-        self._positions: Dict[str, List[Position]] = {}
+        # slug -> (side, entry cents) -> positions; a sell fill removes one by key
+        self._positions: Dict[str, Dict[Tuple[OrderSide, int], List[Position]]] = {}
         self._results: Dict[str, CycleResult] = {}
         
         # Track our orders
-        self._buy_orders: Dict[str, List[TrackedOrder]] = {}  # event -> orders
-        self._sell_orders: Dict[str, List[TrackedOrder]] = {}
-        self._stop_loss_orders: Dict[str, List[TrackedOrder]] = {}  # Stop-loss orders
+        # event -> order_id -> order (insertion-ordered, O(1) lookup by ID)
+        self._buy_orders: Dict[str, Dict[str, TrackedOrder]] = {}
+        self._sell_orders: Dict[str, Dict[str, TrackedOrder]] = {}
         
         # Track which orders we've seen as filled (order IDs)
         self._known_filled: Set[str] = set()
         
+        # Orders to look at this cycle: changed on the user channel, or None = check all (see begin_cycle)
+        self._updated_order_ids: Optional[Set[str]] = None
+        self._recheck_ids: Set[str] = set()  # Lookups that came back empty - retried next cycle
+        self._last_full_recheck = 0.0  # time.monotonic() of the last check-everything cycle
+        
+        # Open orders, fetched at most once per cycle; dropped whenever we place a sell
+        self._cycle_open_orders: Optional[List[Dict]] = None
+        
         # Queue for sells that failed to place (will retry each cycle)
         self._pending_sells: List[Dict] = []  # [{token_id, side, exit_price, size, slug, entry_price, attempts}]
         
         # Accumulator for partial fills below minimum order size (6 shares)
-        # Key: (slug, side, token_id, exit_price), Value: {size: float, total_entry_value: float}
-        self._fill_accumulator: Dict[tuple, Dict] = {}
+        # Key: "token_id:exit_cents" (token_id already implies slug + side),
+        # Value: {size: float, total_entry_value: float}
+        self._fill_accumulator: Dict[str, Dict] = {}
+        # Key -> (slug, side, token_id, exit_price), written once when the key is created
+        self._acc_meta: Dict[str, tuple] = {}
+        # slug -> sells with a stop-loss entry still being tracked (no stop-loss scan at 0)
+        self._sl_outstanding: Dict[str, int] = {}
+        # slug -> tracked orders not yet retired (_track / _retire keep it current)
+        self._pending_counts: Dict[str, int] = {}
+        # Reload buys (order specs) collected by _process_sell_fill (see _flush_reloads)
+        self._reloads: List[tuple] = []
     
     def _get_exit_price(self, entry_price: float) -> float:
         """
@@ -62,20 +96,20 @@ class StrategyEngine:
         - 46-47¢ entry → 48¢ exit
         - 40-45¢ entry → 47¢ exit
         """
-        # Round to avoid float precision issues
-        entry_rounded = round(entry_price, 2)
-        exit_price = EXIT_PRICES.get(entry_rounded)
+        # Integer cents avoid float precision issues (and float-keyed lookups)
+        entry_cents = _cents(entry_price)
+        exit_cents = EXIT_PRICES_CENTS[entry_cents] if 0 <= entry_cents < len(EXIT_PRICES_CENTS) else None
         
-        if exit_price is None:
+        if exit_cents is None:
             # DIAGNOSTIC: Log when using default (potential issue)
             logger.warning(
-                f"⚠️ Entry price {entry_price:.6f} (rounded: {entry_rounded}) "
+                f"⚠️ Entry price {entry_price:.6f} (rounded: {entry_cents}¢) "
                 f"NOT in EXIT_PRICES map! Using default 49¢. "
                 f"Available keys: {sorted(EXIT_PRICES.keys())}"
             )
             return 0.49
         
-        return exit_price
+        return exit_cents / 100
 
     def _clamp_size(self, size: float) -> float:
         """Clamp size to 6 decimal places and avoid negative/float drift."""
@@ -89,10 +123,28 @@ class StrategyEngine:
             return False
         return (size * price) >= MIN_NOTIONAL
     
-    def _needs_stop_loss(self, entry_price: float) -> bool:
-        """Check if an entry price needs a stop-loss order."""
-        entry_rounded = round(entry_price, 2)
-        return entry_rounded in STOP_LOSS_ENTRIES
+    def _set_entry(self, sell_order: TrackedOrder, entry_price: float) -> None:
+        """Link a sell to its entry; cents and the stop-loss check are decided here, once."""
+        sell_order.entry_price = entry_price
+        sell_order.entry_cents = _cents(entry_price)
+        sell_order.needs_sl = sell_order.entry_cents in STOP_LOSS_ENTRIES_CENTS
+        if sell_order.needs_sl:
+            slug = sell_order.event_slug
+            self._sl_outstanding[slug] = self._sl_outstanding.get(slug, 0) + 1
+    
+    def _track(self, orders: Dict[str, Dict[str, TrackedOrder]], order: TrackedOrder) -> None:
+        """Start tracking an order in one of the per-slug order books (_buy_orders or _sell_orders)."""
+        orders.setdefault(order.event_slug, {})[order.order_id] = order
+        self._pending_counts[order.event_slug] = self._pending_counts.get(order.event_slug, 0) + 1
+    
+    def _retire(self, order: TrackedOrder) -> None:
+        """Stop tracking an order (filled, cancelled or replaced)."""
+        if order.order_id in self._known_filled:
+            return
+        self._known_filled.add(order.order_id)
+        self._pending_counts[order.event_slug] -= 1
+        if order.needs_sl:
+            self._sl_outstanding[order.event_slug] -= 1
     
     def initialize_event(self, event: EventContext) -> int:
         """
@@ -110,7 +162,7 @@ class StrategyEngine:
             return 0  # Already initialized
         
         # DEFENSIVE CHECK: Reject LIVE or ENDED events
-        if event.phase != MarketPhase.PRE_MARKET:
+        if event.phase is not MarketPhase.PRE_MARKET:
             logger.error(
                 f"❌ REJECTED: Cannot initialize {slug} - event is {event.phase.name}. "
                 f"Only PRE_MARKET events allowed!"
@@ -118,11 +170,12 @@ class StrategyEngine:
             return 0
         
         self._states[slug] = StrategyState.ACCUMULATING
-        self._positions[slug] = []
+        self._positions[slug] = {}
         self._results[slug] = CycleResult(event_slug=slug, start_time=time.time())
-        self._buy_orders[slug] = []
-        self._sell_orders[slug] = []
-        self._stop_loss_orders[slug] = []
+        self._buy_orders[slug] = {}
+        self._sell_orders[slug] = {}
+        self._sl_outstanding[slug] = 0
+        self._pending_counts[slug] = 0
         
         # =================================================================
         # STATE RECOVERY: Check if we already have orders for this event
@@ -169,9 +222,9 @@ class StrategyEngine:
                         
                         # Add to appropriate list
                         if order_type == OrderType.BUY:
-                            self._buy_orders[slug].append(tracked)
+                            self._track(self._buy_orders, tracked)
                         else:
-                            self._sell_orders[slug].append(tracked)
+                            self._track(self._sell_orders, tracked)
                             
                         recovered_count += 1
                         
@@ -192,24 +245,20 @@ class StrategyEngine:
 
         orders_placed = 0
         
-        # Place ladder on both YES and NO
-        for side, token_id in [
-            (OrderSide.YES, event.yes_token_id),
-            (OrderSide.NO, event.no_token_id)
-        ]:
-            for price in LADDER_LEVELS:
-                order = self.client.place_limit_order(
-                    token_id=token_id,
-                    side=side,
-                    order_type=OrderType.BUY,
-                    price=price,
-                    size=ORDER_SIZE,
-                    event_slug=slug
-                )
-                
-                if order:
-                    self._buy_orders[slug].append(order)
-                    orders_placed += 1
+        # Place ladder on both YES and NO - all levels in one batch POST
+        ladder = [
+            (token_id, side, OrderType.BUY, price, ORDER_SIZE, slug)
+            for side, token_id in [
+                (OrderSide.YES, event.yes_token_id),
+                (OrderSide.NO, event.no_token_id)
+            ]
+            for price in LADDER_LEVELS
+        ]
+        
+        for order in self.client.place_limit_orders_batch(ladder):
+            if order:
+                self._track(self._buy_orders, order)
+                orders_placed += 1
         
         logger.info(f"🪜 Ladder placed for {slug}: {orders_placed} orders")
         
@@ -219,6 +268,44 @@ class StrategyEngine:
         
         return orders_placed
     
+    def begin_cycle(self, open_orders: Optional[List[Dict]] = None) -> None:
+        """
+        Collect the order changes pushed by the user channel since the last cycle.
+        Call ONCE per cycle from main.py, before check_fills.
+        
+        open_orders (this cycle's get_open_orders() result, if the caller has it) is
+        reused by every locked-in-sells check; otherwise it is fetched on first use.
+        
+        check_fills then only looks up orders that changed. Every FULL_RECHECK_SECONDS
+        (or whenever the feed may have missed updates) all orders are checked as before.
+        """
+        self._cycle_open_orders = open_orders
+        updated = self.client.drain_order_updates()
+        now = time.monotonic()
+        
+        if updated is None or now - self._last_full_recheck >= FULL_RECHECK_SECONDS:
+            self._updated_order_ids = None
+            self._last_full_recheck = now
+        else:
+            updated |= self._recheck_ids
+            self._updated_order_ids = updated
+        self._recheck_ids = set()
+    
+    def _open_orders(self) -> List[Dict]:
+        """This cycle's open orders (fetched again only after we placed a sell)."""
+        if self._cycle_open_orders is None:
+            self._cycle_open_orders = self.client.get_open_orders()
+        return self._cycle_open_orders
+    
+    def _locked_in_sells(self, token_id: str) -> float:
+        """Shares of token_id locked in our open SELL orders (Polymarket locks them until filled/cancelled)."""
+        return sum(
+            float(o.get("size", 0)) - float(o.get("size_matched", 0) or o.get("sizeMatched", 0))
+            for o in self._open_orders()
+            if o.get("asset_id") == token_id
+            and o.get("side", "").upper() == "SELL"
+        )
+    
     def check_fills(self, event: EventContext, open_order_ids: Optional[Set[str]] = None) -> Optional[Set[str]]:
         """
         Check for filled orders and process them.
@@ -235,34 +322,71 @@ class StrategyEngine:
         
         # Use provided open_order_ids or fetch (fallback)
         if open_order_ids is None:
-            open_orders = self.client.get_open_orders()
-            open_order_ids = {o.get("id") for o in open_orders}
+            open_order_ids = self.client.get_open_order_ids()
         
         # =================================================================
         # CHECK BUY ORDERS (OPTIMIZED: Priority check + smart filtering)
         # =================================================================
-        # Sort by price DESC (48¢ first - most likely to fill)
-        buy_orders = self._buy_orders.get(slug, [])
-        active_buys = [o for o in buy_orders if o.order_id not in self._known_filled]
-        active_buys_sorted = sorted(active_buys, key=lambda o: o.price, reverse=True)
-        
-        for order in active_buys_sorted:
+        buys = self._buy_orders.get(slug, {})
+        sells = self._sell_orders.get(slug, {})
+        known_filled = self._known_filled
+        
+        updated = self._updated_order_ids
+        if updated is not None:
+            # User channel is live: only orders it reported changed (fills push an update).
+            # Look those IDs up instead of walking every order the event ever placed.
+            buys_to_check = []
+            sells_to_check = []
+            for oid in updated:
+                if oid in known_filled:
+                    continue
+                order = buys.get(oid)
+                if order is not None:
+                    buys_to_check.append(order)
+                    continue
+                order = sells.get(oid)
+                if order is not None and oid not in open_order_ids:
+                    sells_to_check.append(order)
+        else:
             # OPTIMIZATION: Only call get_order() if:
             # 1. Order disappeared from open_order_ids (likely filled/cancelled), OR
             # 2. Order is at high price (48¢+) - check every cycle for fast response
-            is_high_priority = order.price >= 0.46  # 46¢+ orders checked every cycle
-            order_missing = order.order_id not in open_order_ids
-            
-            if not (order_missing or is_high_priority):
-                continue  # Skip low-priority orders that are still open
-            
+            buys_to_check = [
+                o for oid, o in buys.items()
+                if oid not in known_filled
+                and (oid not in open_order_ids or o.price >= 0.46)  # 46¢+ orders checked every cycle
+            ]
+            sells_to_check = [
+                o for oid, o in sells.items()
+                if oid not in known_filled and oid not in open_order_ids
+            ]
+        # Sort by price DESC (48¢ first - most likely to fill)
+        buys_to_check.sort(key=lambda o: o.price, reverse=True)
+        
+        # Stop-loss candidates: open sells from a stop-loss entry (none to look for
+        # on most events)
+        if self._sl_outstanding.get(slug, 0) > 0:
+            sl_candidates = [
+                o for oid, o in sells.items()
+                if o.needs_sl and oid in open_order_ids and oid not in known_filled
+            ]
+        else:
+            sl_candidates = []
+        
+        # Fetch every order we need this cycle in one concurrent batch. Reconcile
+        # passes go to REST: a fill the user channel missed sits in its cache as LIVE.
+        orders_data = self.client.get_orders_batch(
+            [o.order_id for o in buys_to_check] + [o.order_id for o in sells_to_check],
+            fresh=updated is None
+        )
+        
+        for order in buys_to_check:
             try:
-                order_data = self.client.get_order(order.order_id)
+                order_data = orders_data.get(order.order_id)
                 
                 if not order_data:
                     # IMPROVEMENT: Track API failures to detect phantom fills
-                    if not hasattr(order, 'api_fail_count'):
-                        order.api_fail_count = 0
+                    self._recheck_ids.add(order.order_id)
                     order.api_fail_count += 1
                     
                     if order.api_fail_count >= 20:  # ~10 seconds of failures
@@ -278,8 +402,7 @@ class StrategyEngine:
                     continue
                 
                 # Reset fail counter on success
-                if hasattr(order, 'api_fail_count'):
-                    order.api_fail_count = 0
+                order.api_fail_count = 0
                 
                 size_matched = float(order_data.get("size_matched") or order_data.get("sizeMatched") or 0)
                 status = order_data.get("status", "").upper()
@@ -289,7 +412,7 @@ class StrategyEngine:
                     delta_fill = size_matched - order.processed_size
                     
                     if delta_fill > 0.000001:  # Floating point tolerance
-                        logger.info(f"✅ BUY fill: +{delta_fill:.2f} shares @ {order.price:.2f}¢ → Total: {size_matched:.2f}")
+                        logger.info("✅ BUY fill: +%.2f shares @ %.2f¢ → Total: %.2f", delta_fill, order.price, size_matched)
                         
                         # Process the fill IMMEDIATELY
                         safe_delta = round(delta_fill, 6)
@@ -298,131 +421,134 @@ class StrategyEngine:
                     
                     # Mark complete if fully filled
                     api_original_size = float(order_data.get("original_size") or order_data.get("originalSize") or order.size)
-                    if size_matched >= api_original_size or status in ["MATCHED", "CANCELLED"]:
-                        self._known_filled.add(order.order_id)
+                    if size_matched >= api_original_size or status in _CLOSED_STATUSES:
+                        self._retire(order)
                 
-                elif status in ["CANCELLED", "INVALID", "EXPIRED", "REJECTED"]:
+                elif status in _DEAD_STATUSES:
                     # Order is dead with 0 fills - stop tracking
-                    logger.debug(f"🗑️ BUY order {order.order_id[:10]} is {status} (0 fills). Removed.")
-                    self._known_filled.add(order.order_id)
+                    logger.debug("🗑️ BUY order %.10s is %s (0 fills). Removed.", order.order_id, status)
+                    self._retire(order)
                     
             except Exception as e:
+                self._recheck_ids.add(order.order_id)
                 if order.order_id not in open_order_ids:
-                    logger.debug(f"Order {order.order_id[:10]} not found (likely filled): {e}")
+                    logger.debug("Order %.10s not found (likely filled): %s", order.order_id, e)
                 else:
                     logger.error(f"❌ Error checking order {order.order_id[:10]}: {e}")
 
         
         # Check sell orders (take-profit)
-        for order in self._sell_orders.get(slug, []):
+        # Sells placed by the buy fills above are picked up next cycle
+        for order in sells_to_check:
             if order.order_id in self._known_filled:
                 continue
             
-            if order.order_id not in open_order_ids:
-                try:
-                    # 🛡️ SAFETY CHECK
-                    order_data = self.client.get_order(order.order_id)
-                    
-                    # Skip if API returned None (order not found yet)
-                    if order_data is None:
-                        logger.debug(f"⏳ Order {order.order_id[:10]}... not found in API yet, will retry")
-                        continue
-                    
-                    size_matched = float(order_data.get("size_matched") or order_data.get("sizeMatched") or 0)
-                    original_size = float(order_data.get("original_size") or order_data.get("originalSize") or order.size)
-                    status = order_data.get("status", "").upper()
-                    
-                    if size_matched > 0:
-                        # Update size to actual filled amount
-                        order.size = size_matched
-                        self._process_sell_fill(order, event, is_stop_loss=False)
-                        
-                        # Only mark complete if FULLY filled or explicitly done
-                        if size_matched >= original_size or status == "MATCHED":
-                            self._known_filled.add(order.order_id)
-                        else:
-                            # PARTIAL FILL: Log info, order stays open for remaining
-                            logger.info(f"📊 PARTIAL SELL: {size_matched}/{original_size} shares filled. Waiting...")
+            try:
+                # 🛡️ SAFETY CHECK
+                order_data = orders_data.get(order.order_id)
+                
+                # Skip if API returned nothing (order not found yet)
+                if not order_data:
+                    logger.debug("⏳ Order %.10s... not found in API yet, will retry", order.order_id)
+                    self._recheck_ids.add(order.order_id)
+                    continue
+                
+                size_matched = float(order_data.get("size_matched") or order_data.get("sizeMatched") or 0)
+                original_size = float(order_data.get("original_size") or order_data.get("originalSize") or order.size)
+                status = order_data.get("status", "").upper()
+                
+                if size_matched > 0:
+                    # Update size to actual filled amount
+                    order.size = size_matched
+                    self._process_sell_fill(order, event)
                     
-                    elif status in ["CANCELED", "CANCELLED", "INVALID", "EXPIRED", "REJECTED"]:
-                        # 🗑️ Order is dead and has 0 fills. Stop tracking it.
-                        logger.debug(f"🗑️ SELL order {order.order_id[:10]} is {status} (0 fills). Removed.")
-                        self._known_filled.add(order.order_id)
-                         
-                except Exception as e:
-                    logger.error(f"❌ Error verifying sell fill for {order.order_id[:10]}: {e}")
-                    # Track API failures for this order
-                    if not hasattr(order, 'verify_fail_count'):
-                        order.verify_fail_count = 0
-                    order.verify_fail_count += 1
+                    # Only mark complete if FULLY filled or explicitly done
+                    if size_matched >= original_size or status == "MATCHED":
+                        self._retire(order)
+                    else:
+                        # PARTIAL FILL: Log info, order stays open for remaining
+                        logger.info("📊 PARTIAL SELL: %s/%s shares filled. Waiting...", size_matched, original_size)
+                
+                elif status in _DEAD_STATUSES:
+                    # 🗑️ Order is dead and has 0 fills. Stop tracking it.
+                    logger.debug("🗑️ SELL order %.10s is %s (0 fills). Removed.", order.order_id, status)
+                    self._retire(order)
+                     
+            except Exception as e:
+                logger.error(f"❌ Error verifying sell fill for {order.order_id[:10]}: {e}")
+                # Track API failures for this order
+                self._recheck_ids.add(order.order_id)
+                order.verify_fail_count += 1
+                
+                if order.verify_fail_count >= 3:  # FAST recovery: only 3 attempts
+                    logger.error(
+                        f"⚠️ SELL order {order.order_id[:10]} desapareció! Recuperación RÁPIDA..."
+                    )
                     
-                    if order.verify_fail_count >= 3:  # FAST recovery: only 3 attempts
-                        logger.error(
-                            f"⚠️ SELL order {order.order_id[:10]} desapareció! Recuperación RÁPIDA..."
-                        )
+                    # RESILIENCE: Check actual token balance to decide action
+                    try:
+                        actual_balance = self.client.get_token_balance(order.token_id)
                         
-                        # RESILIENCE: Check actual token balance to decide action
-                        try:
-                            actual_balance = self.client.get_token_balance(order.token_id)
+                        if actual_balance >= order.size * 0.99:  # We still have the tokens
+                            logger.warning(
+                                f"🔄 RECOVERY RÁPIDA: Tokens en wallet ({actual_balance:.2f} shares). "
+                                f"Recolocando venta en <3 segundos..."
+                            )
+                            # Add to pending sells for retry
+                            pending = {
+                                'token_id': order.token_id,
+                                'side': order.side,
+                                'exit_price': order.price,
+                                'size': order.size,
+                                'slug': slug,
+                                'entry_price': order.entry_price or 0,
+                                'attempts': 0
+                            }
+                            self._pending_sells.append(pending)
+                            self._retire(order)  # Stop tracking the old order
+                            order.verify_fail_count = 0  # Reset on success
                             
-                            if actual_balance >= order.size * 0.99:  # We still have the tokens
-                                logger.warning(
-                                    f"🔄 RECOVERY RÁPIDA: Tokens en wallet ({actual_balance:.2f} shares). "
-                                    f"Recolocando venta en <3 segundos..."
-                                )
-                                # Add to pending sells for retry
-                                pending = {
-                                    'token_id': order.token_id,
-                                    'side': order.side,
-                                    'exit_price': order.price,
-                                    'size': order.size,
-                                    'slug': slug,
-                                    'entry_price': order.entry_price or 0,
-                                    'attempts': 0
-                                }
-                                self._pending_sells.append(pending)
-                                self._known_filled.add(order.order_id)  # Stop tracking the old order
-                                order.verify_fail_count = 0  # Reset on success
-                                
-                                self.notifier.send_message(
-                                    f"🔄 RECOVERY RÁPIDA (<3s):\n"
-                                    f"Venta {order.price:.2f}¢ recolocada automáticamente\n"
-                                    f"{order.size:.0f} shares | {slug}"
-                                )
-                            else:
-                                # Tokens not found - likely sold or error
-                                logger.warning(
-                                    f"✅ RECOVERY RÁPIDA: Tokens vendidos (balance={actual_balance:.2f}). "
-                                    f"Procesando como venta ejecutada en <3s."
-                                )
-                                self._known_filled.add(order.order_id)
-                                order.verify_fail_count = 0  # Reset on success
-                                
-                                # Try to process as sell fill (PnL might be off but better than losing track)
-                                if order.entry_price and order.entry_price > 0:
-                                    self._process_sell_fill(order, event, is_stop_loss=False)
-                                
-                        except Exception as balance_err:
-                            logger.error(f"❌ Recovery attempt #{order.verify_fail_count} failed: {balance_err}")
-                            # NO resetear contador - seguir intentando en próximos ciclos
-                            # Enviar alerta solo cada 10 intentos para no spamear
-                            if order.verify_fail_count % 10 == 0:
-                                self.notifier.send_message(
-                                    f"⚠️ API CAÍDA (intento {order.verify_fail_count}):\n"
-                                    f"No se puede verificar orden {order.order_id[:10]}.\n"
-                                    f"El bot seguirá intentando automáticamente."
-                                )
+                            self.notifier.send_message(
+                                f"🔄 RECOVERY RÁPIDA (<3s):\n"
+                                f"Venta {order.price:.2f}¢ recolocada automáticamente\n"
+                                f"{order.size:.0f} shares | {slug}"
+                            )
                         else:
-                            # Success: reset counter and stop tracking this order
-                            order.verify_fail_count = 0
+                            # Tokens not found - likely sold or error
+                            logger.warning(
+                                f"✅ RECOVERY RÁPIDA: Tokens vendidos (balance={actual_balance:.2f}). "
+                                f"Procesando como venta ejecutada en <3s."
+                            )
+                            self._retire(order)
+                            order.verify_fail_count = 0  # Reset on success
+                            
+                            # Try to process as sell fill (PnL might be off but better than losing track)
+                            if order.entry_price and order.entry_price > 0:
+                                self._process_sell_fill(order, event)
+                            
+                    except Exception as balance_err:
+                        logger.error(f"❌ Recovery attempt #{order.verify_fail_count} failed: {balance_err}")
+                        # NO resetear contador - seguir intentando en próximos ciclos
+                        # Enviar alerta solo cada 10 intentos para no spamear
+                        if order.verify_fail_count % 10 == 0:
+                            self.notifier.send_message(
+                                f"⚠️ API CAÍDA (intento {order.verify_fail_count}):\n"
+                                f"No se puede verificar orden {order.order_id[:10]}.\n"
+                                f"El bot seguirá intentando automáticamente."
+                            )
+                    else:
+                        # Success: reset counter and stop tracking this order
+                        order.verify_fail_count = 0
 
         # NOTE: Pending sells are processed once per cycle in main.py, not per-event
         
+        self._flush_reloads()
+        
         # =========================================================================
         # STOP-LOSS MONITOR (Client-Side)
         # Only for 48¢ entries: If market drops to 18¢, dump at market price
         # =========================================================================
-        self._check_stop_loss(event, open_order_ids)
+        self._check_stop_loss(event, sl_candidates)
         
         # Return cached IDs for reuse in check_completion (avoids extra API call)
         return open_order_ids
@@ -438,6 +564,7 @@ class StrategyEngine:
             return
         
         still_pending = []
+        retries = []
         
         for pending in self._pending_sells:
             pending['size'] = self._clamp_size(pending['size'])
@@ -450,23 +577,26 @@ class StrategyEngine:
                 )
                 # Don't retry, it will always fail
                 continue
-            
-            sell_order = self.client.place_limit_order(
-                token_id=pending['token_id'],
-                side=pending['side'],
-                order_type=OrderType.SELL,
-                price=pending['exit_price'],
-                size=pending['size'],
-                event_slug=pending['slug']
-            )
-            
+            retries.append(pending)
+        
+        if not retries:
+            self._pending_sells = still_pending
+            return
+        
+        # All retries go out in ONE batched post (failures fall through to the
+        # attempts logic below and are retried next cycle)
+        self._cycle_open_orders = None  # New sells change the locked balance
+        placed = self.client.place_limit_orders_batch([
+            (pending['token_id'], pending['side'], OrderType.SELL,
+             pending['exit_price'], pending['size'], pending['slug'])
+            for pending in retries
+        ])
+        
+        for pending, sell_order in zip(retries, placed):
             if sell_order:
-                sell_order.entry_price = pending['entry_price']
+                self._set_entry(sell_order, pending['entry_price'])
                 slug = pending['slug']
-                if slug in self._sell_orders:
-                    self._sell_orders[slug].append(sell_order)
-                else:
-                    self._sell_orders[slug] = [sell_order]
+                self._track(self._sell_orders, sell_order)
                     
                 logger.info(
                     f"✅ PENDING SELL placed (attempt {pending['attempts']+1}): "
@@ -491,13 +621,8 @@ class StrategyEngine:
                     
                     # ⚠️ CRITICAL: Check if tokens are already locked in open sell orders
                     # Polymarket locks tokens when you have an open sell order
-                    open_orders = self.client.get_open_orders()
-                    locked_in_sells = sum(
-                        float(o.get("size", 0)) - float(o.get("size_matched", 0) or o.get("sizeMatched", 0))
-                        for o in open_orders
-                        if o.get("asset_id") == pending['token_id'] 
-                        and o.get("side", "").upper() == "SELL"
-                    )
+                    open_orders = self._open_orders()
+                    locked_in_sells = self._locked_in_sells(pending['token_id'])
                     
                     available_balance = actual_balance - locked_in_sells
                     
@@ -598,13 +723,7 @@ class StrategyEngine:
                                 final_balance = self.client.get_token_balance(pending['token_id'])
                                 
                                 # Check if tokens are locked in OTHER sell orders
-                                open_orders = self.client.get_open_orders()
-                                locked_in_other_sells = sum(
-                                    float(o.get("size", 0)) - float(o.get("size_matched", 0) or o.get("sizeMatched", 0))
-                                    for o in open_orders
-                                    if o.get("asset_id") == pending['token_id'] 
-                                    and o.get("side", "").upper() == "SELL"
-                                )
+                                locked_in_other_sells = self._locked_in_sells(pending['token_id'])
                                 
                                 total_tokens = final_balance + locked_in_other_sells
                                 
@@ -635,33 +754,44 @@ class StrategyEngine:
         
         self._pending_sells = still_pending
     
-    def _check_stop_loss(self, event: EventContext, open_order_ids: set) -> None:
+    def _flush_reloads(self) -> None:
+        """Place the reload buys collected while processing fills in one batched post."""
+        if not self._reloads:
+            return
+        reloads, self._reloads = self._reloads, []
+        
+        for reload_order in self.client.place_limit_orders_batch(reloads):
+            if reload_order:
+                self._track(self._buy_orders, reload_order)
+                logger.info(f"♻️ RELOAD: Replenished buy @ {_cents(reload_order.price)}¢")
+    
+    def _check_stop_loss(self, event: EventContext, candidates: List[TrackedOrder]) -> None:
         """
         Monitor sell orders from high-risk entries (48¢) for stop-loss.
         If market price drops to STOP_LOSS_PRICE or below, dump at market.
+        
+        candidates: the event's open sells with needs_sl, collected by check_fills
         """
         slug = event.slug
         
+        # Nothing from a stop-loss entry is still open for this event
+        if not candidates:
+            return
+        
         # Get current best bids from event context (populated in main loop)
         current_bids = {
             OrderSide.YES: event.yes_bid,
             OrderSide.NO: event.no_bid
         }
         
-        for order in self._sell_orders.get(slug, []):
-            # Skip if already processed
+        # Collect every triggered position first so cancels and dumps go out in bulk
+        triggered = []  # (take-profit order, market price)
+        
+        for order in candidates:
+            # Skip if processed by a fill earlier this cycle
             if order.order_id in self._known_filled:
                 continue
             
-            # Skip if order is no longer open (already filled)
-            if order.order_id not in open_order_ids:
-                continue
-            
-            # Only check stop-loss for high-risk entries (48¢)
-            entry_price = order.entry_price or 0
-            if not self._needs_stop_loss(entry_price):
-                continue
-            
             # Get current market price (best bid)
             current_market_price = current_bids.get(order.side)
             
@@ -675,68 +805,71 @@ class StrategyEngine:
                     f"🔻 STOP-LOSS TRIGGERED: {order.side.display_name} @ {int(current_market_price*100)}¢ "
                     f"<= {int(STOP_LOSS_PRICE*100)}¢. Dumping position!"
                 )
-                
-                # 1. Cancel the Take-Profit Order to unlock tokens
-                cancel_success = False
-                try:
-                    logger.info(f"🔓 Cancelling TP order {order.order_id[:8]}...")
-                    self.client.cancel_order(order.order_id)
-                    cancel_success = True
-                except Exception as e:
-                    logger.error(f"❌ Failed to cancel TP for SL: {e}")
-                    # CRITICAL FIX: Verify if order was actually cancelled (timeout scenario)
-                    try:
-                        order_status = self.client.get_order(order.order_id)
-                        if order_status is None:
-                            logger.warning("📋 Order not found - likely cancelled. Proceeding with SL...")
-                            cancel_success = True
-                        elif order_status.get("status", "").upper() in ["CANCELLED", "CANCELED", "MATCHED"]:
-                            logger.warning(f"📋 Order status: {order_status.get('status')}. Proceeding with SL...")
-                            cancel_success = True
-                        else:
-                            logger.error(f"❌ Order still active: {order_status.get('status')}. Cannot proceed.")
-                    except Exception as e2:
-                        logger.error(f"❌ Failed to verify order status: {e2}")
-                
-                if not cancel_success:
-                    continue  # Really failed, retry next cycle
-                
-                self._known_filled.add(order.order_id)  # Mark as handled
-                
-                # 2. Execute Market Sell (limit sell at 1¢ to hit any bid)
-                logger.warning(f"📉 Executing MARKET SELL for {order.size} shares...")
-                dump_order = self.client.place_limit_order(
-                    token_id=order.token_id,
-                    side=order.side,
-                    order_type=OrderType.SELL,
-                    price=0.01,  # Market sell (crosses any bid)
-                    size=order.size,
-                    event_slug=slug
-                )
-                
-                if dump_order:
-                    logger.warning(f"✅ STOP-LOSS EXECUTED: Sold {order.size} shares at market")
-                    self.notifier.send_message(
-                        f"🔴 STOP-LOSS EJECUTADO: Vendido {order.size} {order.side.display_name} "
-                        f"a mercado (precio cayó a {int(current_market_price*100)}¢)"
-                    )
+                triggered.append((order, current_market_price))
+        
+        if not triggered:
+            return
+        
+        # 1. Cancel the Take-Profit Orders to unlock tokens (one batch request)
+        tp_ids = [order.order_id for order, _ in triggered]
+        logger.info(f"🔓 Cancelling {len(tp_ids)} TP order(s) for stop-loss...")
+        cancelled = set(self.client.cancel_orders_batch(tp_ids))
+        
+        # CRITICAL FIX: Verify orders the cancel didn't confirm (timeout / already closed)
+        unconfirmed = [oid for oid in tp_ids if oid not in cancelled]
+        if unconfirmed:
+            statuses = self.client.get_orders_batch(unconfirmed)
+            for oid in unconfirmed:
+                order_status = statuses.get(oid)
+                if not order_status:
+                    logger.warning("📋 Order not found - likely cancelled. Proceeding with SL...")
+                    cancelled.add(oid)
+                elif order_status.get("status", "").upper() in _CLOSED_STATUSES:
+                    logger.warning(f"📋 Order status: {order_status.get('status')}. Proceeding with SL...")
+                    cancelled.add(oid)
                 else:
-                    # Failed to place stop-loss - add to pending for retry
-                    logger.error(f"❌ Stop-loss market sell failed. Adding to retry queue...")
-                    pending = {
-                        'token_id': order.token_id,
-                        'side': order.side,
-                        'exit_price': 0.01,  # Market sell
-                        'size': order.size,
-                        'slug': slug,
-                        'entry_price': order.entry_price or 0,
-                        'attempts': 0
-                    }
-                    self._pending_sells.append(pending)
-                    self.notifier.send_message(
-                        f"⚠️ STOP-LOSS: Reintentando venta a mercado.\n"
-                        f"{order.size} {order.side.display_name} (precio cayó a {int(current_market_price*100)}¢)"
-                    )
+                    logger.error(f"❌ Order still active: {order_status.get('status')}. Cannot proceed.")
+        
+        # Really failed cancels are retried next cycle
+        to_dump = [(order, price) for order, price in triggered if order.order_id in cancelled]
+        if not to_dump:
+            return
+        
+        for order, _ in to_dump:
+            self._retire(order)  # Mark as handled
+        
+        # 2. Execute Market Sells (limit sell at 1¢ to hit any bid), one batch request
+        logger.warning(f"📉 Executing MARKET SELL for {len(to_dump)} position(s)...")
+        self._cycle_open_orders = None  # A new sell changes the locked balance
+        dump_orders = self.client.place_limit_orders_batch([
+            (order.token_id, order.side, OrderType.SELL, 0.01, order.size, slug)  # 0.01 = crosses any bid
+            for order, _ in to_dump
+        ])
+        
+        for (order, current_market_price), dump_order in zip(to_dump, dump_orders):
+            if dump_order:
+                logger.warning(f"✅ STOP-LOSS EXECUTED: Sold {order.size} shares at market")
+                self.notifier.send_message(
+                    f"🔴 STOP-LOSS EJECUTADO: Vendido {order.size} {order.side.display_name} "
+                    f"a mercado (precio cayó a {int(current_market_price*100)}¢)"
+                )
+            else:
+                # Failed to place stop-loss - add to pending for retry
+                logger.error(f"❌ Stop-loss market sell failed. Adding to retry queue...")
+                pending = {
+                    'token_id': order.token_id,
+                    'side': order.side,
+                    'exit_price': 0.01,  # Market sell
+                    'size': order.size,
+                    'slug': slug,
+                    'entry_price': order.entry_price or 0,
+                    'attempts': 0
+                }
+                self._pending_sells.append(pending)
+                self.notifier.send_message(
+                    f"⚠️ STOP-LOSS: Reintentando venta a mercado.\n"
+                    f"{order.size} {order.side.display_name} (precio cayó a {int(current_market_price*100)}¢)"
+                )
     
     def _flush_accumulator_for_event(self, event: EventContext) -> None:
         """
@@ -752,7 +885,7 @@ class StrategyEngine:
         slug = event.slug
         
         # Find all accumulator keys for this event
-        keys_to_flush = [k for k in self._fill_accumulator.keys() if k[0] == slug]
+        keys_to_flush = [k for k, meta in self._acc_meta.items() if meta[0] == slug]
         
         # =========================================================================
         # PHASE 1: Process accumulators with >= MIN_SHARES (normal flow)
@@ -765,7 +898,7 @@ class StrategyEngine:
             if acc['size'] < 0.001:  # Skip empty accumulators
                 continue
                 
-            _, side, token_id, exit_price = acc_key
+            _, side, token_id, exit_price = self._acc_meta[acc_key]
             sell_size = acc['size']
             avg_entry = acc['total_entry_value'] / acc['size'] if acc['size'] > 0 else 0
             
@@ -797,13 +930,7 @@ class StrategyEngine:
                 actual_balance = self.client.get_token_balance(token_id)
                 
                 # Check tokens locked in open sell orders
-                open_orders = self.client.get_open_orders()
-                locked_in_sells = sum(
-                    float(o.get("size", 0)) - float(o.get("size_matched", 0) or o.get("sizeMatched", 0))
-                    for o in open_orders
-                    if o.get("asset_id") == token_id 
-                    and o.get("side", "").upper() == "SELL"
-                )
+                locked_in_sells = self._locked_in_sells(token_id)
                 
                 available_balance = actual_balance - locked_in_sells
                 original_sell_size = sell_size
@@ -946,6 +1073,7 @@ class StrategyEngine:
                         f"({sell_size:.2f} {side.display_name})"
                     )
 
+                    self._cycle_open_orders = None  # A new sell changes the locked balance
                     sell_order = self.client.place_limit_order(
                         token_id=token_id,
                         side=side,
@@ -956,11 +1084,8 @@ class StrategyEngine:
                     )
 
                     if sell_order:
-                        sell_order.entry_price = avg_entry
-                        if slug in self._sell_orders:
-                            self._sell_orders[slug].append(sell_order)
-                        else:
-                            self._sell_orders[slug] = [sell_order]
+                        self._set_entry(sell_order, avg_entry)
+                        self._track(self._sell_orders, sell_order)
 
                         self.notifier.send_message(
                             f"⚠️ DUST MARKET SELL ({slug})\n"
@@ -1000,12 +1125,13 @@ class StrategyEngine:
         
         # DIAGNOSTIC: Log exact prices to detect float precision issues
         logger.info(
-            f"✅ BUY FILLED: {order.side.display_name} @ {entry_price:.2f}¢ → Exit: {exit_price:.2f}¢ ({actual_size:.0f} shares)"
+            "✅ BUY FILLED: %s @ %.2f¢ → Exit: %.2f¢ (%.0f shares)",
+            order.side.display_name, entry_price, exit_price, actual_size
         )
         
         # Notify Telegram
         telegram_msg = (
-            f"✅ BUY FILLED: {order.side.display_name} @ {int(entry_price*100)}¢ ({actual_size:.2f} shares)\n"
+            f"✅ BUY FILLED: {order.side.display_name} @ {_cents(entry_price)}¢ ({actual_size:.2f} shares)\n"
             f"🎯 Target: {int(exit_price*100)}¢"
         )
         success = self.notifier.send_message(telegram_msg)
@@ -1018,9 +1144,10 @@ class StrategyEngine:
             entry_price=entry_price,
             size=actual_size,
             token_id=order.token_id,
-            event_slug=slug
+            event_slug=slug,
+            entry_cents=_cents(entry_price)
         )
-        self._positions[slug].append(position)
+        self._positions[slug].setdefault((order.side, position.entry_cents), []).append(position)
         
         # Record in results
         if order.side == OrderSide.YES:
@@ -1036,18 +1163,19 @@ class StrategyEngine:
         
         # Accumulate fills BY EXIT PRICE to preserve the EXIT_PRICES strategy
         # Key includes exit_price so 47¢→48¢ and 48¢→49¢ entries are tracked separately
-        acc_key = (slug, order.side, order.token_id, exit_price)
+        acc_key = f"{order.token_id}:{_cents(exit_price)}"
         
         if acc_key not in self._fill_accumulator:
             self._fill_accumulator[acc_key] = {'size': 0.0, 'total_entry_value': 0.0}
+            self._acc_meta[acc_key] = (slug, order.side, order.token_id, exit_price)
         
         acc = self._fill_accumulator[acc_key]
         acc['size'] += actual_size
         acc['total_entry_value'] += actual_size * entry_price
         
         logger.info(
-            f"📦 Accumulated: {acc['size']:.0f} shares @ exit {exit_price:.2f}¢ "
-            f"(need {MIN_SHARES} for min)"
+            "📦 Accumulated: %.0f shares @ exit %.2f¢ (need %s for min)",
+            acc['size'], exit_price, MIN_SHARES
         )
         
         # Only place sell when we have enough shares for this specific exit price
@@ -1068,13 +1196,7 @@ class StrategyEngine:
                 actual_balance = self.client.get_token_balance(order.token_id)
                 
                 # Check tokens locked in open sell orders
-                open_orders = self.client.get_open_orders()
-                locked_in_sells = sum(
-                    float(o.get("size", 0)) - float(o.get("size_matched", 0) or o.get("sizeMatched", 0))
-                    for o in open_orders
-                    if o.get("asset_id") == order.token_id 
-                    and o.get("side", "").upper() == "SELL"
-                )
+                locked_in_sells = self._locked_in_sells(order.token_id)
                 
                 available_balance = actual_balance - locked_in_sells
                 
@@ -1189,6 +1311,7 @@ class StrategyEngine:
                 if acc_snapshot['size'] == original_acc_size:
                     self._fill_accumulator[acc_key] = {'size': 0.0, 'total_entry_value': 0.0}
 
+            self._cycle_open_orders = None  # A new sell changes the locked balance
             sell_order = self.client.place_limit_order(
                 token_id=order.token_id,
                 side=order.side,
@@ -1199,9 +1322,9 @@ class StrategyEngine:
             )
             
             if sell_order:
-                sell_order.entry_price = avg_entry
-                self._sell_orders[slug].append(sell_order)
-                logger.info(f"✅ SELL placed: {order.side.display_name} @ {exit_price:.2f}¢ x{sell_size:.0f}")
+                self._set_entry(sell_order, avg_entry)
+                self._track(self._sell_orders, sell_order)
+                logger.info("✅ SELL placed: %s @ %.2f¢ x%.0f", order.side.display_name, exit_price, sell_size)
                 # If we didn't keep remainder earlier, ensure accumulator is cleared
                 if acc_key not in self._fill_accumulator:
                     self._fill_accumulator[acc_key] = {'size': 0.0, 'total_entry_value': 0.0}
@@ -1242,15 +1365,15 @@ class StrategyEngine:
         
         # We need to find the TrackedOrder objects for these IDs
         # They should still be in _buy_orders
-        orders_to_audit = []
-        for order in self._buy_orders.get(event.slug, []):
-            if order.order_id in order_ids:
-                orders_to_audit.append(order)
+        buy_orders = self._buy_orders.get(event.slug, {})
+        orders_to_audit = [buy_orders[oid] for oid in order_ids if oid in buy_orders]
+        
+        # Fetch final status of every audited order in one concurrent batch
+        orders_data = self.client.get_orders_batch([o.order_id for o in orders_to_audit])
         
         for order in orders_to_audit:
             try:
-                # Fetch final status from API
-                order_data = self.client.get_order(order.order_id)
+                order_data = orders_data.get(order.order_id)
                 
                 # Safety: Skip if API returned None
                 if not order_data:
@@ -1282,88 +1405,44 @@ class StrategyEngine:
                         
                     # If fully filled now, mark as known
                     if size_matched >= original_size:
-                        self._known_filled.add(order.order_id)
+                        self._retire(order)
                         
             except Exception as e:
                 logger.error(f"❌ Failed to audit order {order.order_id}: {e}")
                         
 
     
-    def _process_sell_fill(self, order: TrackedOrder, event: EventContext, is_stop_loss: bool = False) -> None:
+    def _process_sell_fill(self, order: TrackedOrder, event: EventContext) -> None:
         """
-        Handle a sell order fill (take-profit or stop-loss).
+        Handle a take-profit sell fill.
         
-        When one fires, we cancel the opposing order (OCO behavior).
+        Stop-loss exits never come through here: _check_stop_loss cancels the
+        take-profit and dumps the position itself.
         """
         slug = event.slug
         
         # Calculate PnL
         entry_price = order.entry_price or 0
+        entry_cents = order.entry_cents
         pnl = (order.price - entry_price) * order.size
         self._results[slug].total_pnl += pnl
         
-        # Log appropriately based on order type
-        if is_stop_loss:
-            logger.warning(
-                f"🛑 STOP-LOSS HIT: {order.side.display_name} "
-                f"{int(entry_price*100)}¢ → {int(order.price*100)}¢ | Loss: ${abs(pnl):.2f}"
-            )
-        else:
-            logger.info(
-                f"✅ TAKE-PROFIT: {order.side.display_name} "
-                f"{int(entry_price*100)}¢ → {int(order.price*100)}¢ | PnL: ${pnl:.2f}"
-            )
+        logger.info(
+            "✅ TAKE-PROFIT: %s %d¢ → %d¢ | PnL: $%.2f",
+            order.side.display_name, entry_cents, _cents(order.price), pnl
+        )
         
-        # OCO (One-Cancels-Other) logic for 48¢ entries:
-        # If take-profit fires, cancel the stop-loss and vice versa
-        if self._needs_stop_loss(entry_price):
-            if is_stop_loss:
-                # Stop-loss fired - cancel the take-profit
-                for sell in self._sell_orders.get(slug, []):
-                    if (sell.entry_price and abs(sell.entry_price - entry_price) < 0.001 
-                        and sell.side == order.side
-                        and sell.order_id not in self._known_filled):
-                        self.client.cancel_order(sell.order_id)
-                        self._known_filled.add(sell.order_id)
-                        logger.info(f"🔄 OCO: Cancelled take-profit for closed position")
-                        break
-            else:
-                # Take-profit fired - cancel the stop-loss
-                for stop in self._stop_loss_orders.get(slug, []):
-                    if (stop.entry_price and abs(stop.entry_price - entry_price) < 0.001
-                        and stop.side == order.side
-                        and stop.order_id not in self._known_filled):
-                        self.client.cancel_order(stop.order_id)
-                        self._known_filled.add(stop.order_id)
-                        logger.info(f"🔄 OCO: Cancelled stop-loss for closed position")
-                        break
-        
-        # Remove position
-        positions = self._positions.get(slug, [])
-        for pos in positions:
-            if pos.side == order.side and abs(pos.entry_price - entry_price) < 0.001:
-                positions.remove(pos)
-                break
+        # Remove position (oldest one with this side and entry)
+        positions = self._positions.get(slug, {}).get((order.side, entry_cents))
+        if positions:
+            positions.pop(0)
         
         self.notifier.send_fill(order, pnl=pnl)
         
-        # RELOAD LOGIC: Re-place buy if in pre-market (only for take-profit exits)
-        # Don't reload on stop-loss - that would be chasing losses
-        if self._states.get(slug) == StrategyState.ACCUMULATING and not is_stop_loss:
+        # RELOAD LOGIC: Re-place buy if in pre-market
+        if self._states.get(slug) is StrategyState.ACCUMULATING:
             token_id = event.yes_token_id if order.side == OrderSide.YES else event.no_token_id
-            
-            reload_order = self.client.place_limit_order(
-                token_id=token_id,
-                side=order.side,
-                order_type=OrderType.BUY,
-                price=entry_price,
-                size=order.size,
-                event_slug=slug
-            )
-            
-            if reload_order:
-                self._buy_orders[slug].append(reload_order)
-                logger.info(f"♻️ RELOAD: Replenished buy @ {int(entry_price*100)}¢")
+            self._reloads.append((token_id, order.side, OrderType.BUY, entry_price, order.size, slug))
     
     def transition_to_live(self, event: EventContext) -> int:
         """
@@ -1375,18 +1454,21 @@ class StrategyEngine:
         """
         slug = event.slug
         
-        if self._states.get(slug) != StrategyState.ACCUMULATING:
+        if self._states.get(slug) is not StrategyState.ACCUMULATING:
             return 0
         
+        # Runs before main.py's per-cycle open-orders fetch - don't reuse last cycle's
+        self._cycle_open_orders = None
+        
         # Collect all unfilled buy order IDs for batch cancellation
         order_ids_to_cancel = [
             order.order_id
-            for order in self._buy_orders.get(slug, [])
+            for order in self._buy_orders.get(slug, {}).values()
             if order.order_id not in self._known_filled
         ]
         
         # Batch cancel (one API call instead of many)
-        cancelled = self.client.cancel_orders_batch(order_ids_to_cancel)
+        cancelled = len(self.client.cancel_orders_batch(order_ids_to_cancel))
         
         # =========================================================================
         # 🛡️ RACE CONDITION AUDIT
@@ -1423,49 +1505,61 @@ class StrategyEngine:
         """
         slug = event.slug
         
-        if self._states.get(slug) != StrategyState.EXITING:
+        if self._states.get(slug) is not StrategyState.EXITING:
             return False
         
-        # Use cached IDs if provided, otherwise fetch
-        if cached_open_ids is None:
-            open_orders = self.client.get_open_orders()
-            open_ids = {o.get("id") for o in open_orders}
-        else:
-            open_ids = cached_open_ids
-        
         # Track sells that are still open vs disappeared
         pending_sells = []
         disappeared_sells = []
         
-        for o in self._sell_orders.get(slug, []):
-            if o.order_id in self._known_filled:
-                continue  # Already processed
-            
+        active_sells = [o for o in self._sell_orders.get(slug, {}).values() if o.order_id not in self._known_filled]
+        
+        # Use cached IDs if provided, otherwise fetch (nothing to look up without active sells)
+        if not active_sells:
+            open_ids = set()
+        elif cached_open_ids is None:
+            open_ids = self.client.get_open_order_ids()
+        else:
+            open_ids = cached_open_ids
+        
+        # Split ONCE: open_ids may be the client's live set, changing under us as WS
+        # updates arrive - the fetched IDs and the loop below must agree
+        missing_sells = []
+        for o in active_sells:
             if o.order_id in open_ids:
                 pending_sells.append(o)
             else:
-                # Order disappeared - check if it was filled or just cancelled
-                try:
-                    order_data = self.client.get_order(o.order_id)
-                    if order_data:
-                        size_matched = float(order_data.get("size_matched") or order_data.get("sizeMatched") or 0)
-                        if size_matched > 0:
-                            # Was filled - process it
-                            o.size = size_matched
-                            self._process_sell_fill(o, event, is_stop_loss=False)
-                            self._known_filled.add(o.order_id)
-                        else:
-                            # Disappeared with 0 fills = cancelled by event resolution
-                            disappeared_sells.append(o)
-                            self._known_filled.add(o.order_id)
+                missing_sells.append(o)
+        
+        # Orders that disappeared - fetch them all at once to see if they filled or were cancelled.
+        # Straight from REST: a sell we haven't seen fill may be one the user channel missed.
+        orders_data = self.client.get_orders_batch([o.order_id for o in missing_sells], fresh=True)
+        
+        for o in missing_sells:
+            # Order disappeared - check if it was filled or just cancelled
+            try:
+                order_data = orders_data.get(o.order_id)
+                if order_data:
+                    size_matched = float(order_data.get("size_matched") or order_data.get("sizeMatched") or 0)
+                    if size_matched > 0:
+                        # Was filled - process it
+                        o.size = size_matched
+                        self._process_sell_fill(o, event)
+                        self._retire(o)
                     else:
-                        # API returned None - assume cancelled
+                        # Disappeared with 0 fills = cancelled by event resolution
                         disappeared_sells.append(o)
-                        self._known_filled.add(o.order_id)
-                except Exception as e:
-                    logger.warning(f"⚠️ Could not verify sell {o.order_id[:10]}: {e}")
+                        self._retire(o)
+                else:
+                    # API returned None - assume cancelled
                     disappeared_sells.append(o)
-                    self._known_filled.add(o.order_id)
+                    self._retire(o)
+            except Exception as e:
+                logger.warning(f"⚠️ Could not verify sell {o.order_id[:10]}: {e}")
+                disappeared_sells.append(o)
+                self._retire(o)
+        
+        self._flush_reloads()
         
         # Alert about sells that didn't execute
         if disappeared_sells:
@@ -1513,13 +1607,7 @@ class StrategyEngine:
                     f"Posiciones probablemente liquidadas al precio de resolución."
                 )
         
-        has_pending_stops = any(
-            o.order_id in open_ids
-            for o in self._stop_loss_orders.get(slug, [])
-            if o.order_id not in self._known_filled
-        )
-        
-        if not pending_sells and not has_pending_stops:
+        if not pending_sells:
             self._states[slug] = StrategyState.COMPLETED
             self._results[slug].end_time = time.time()
             
@@ -1527,10 +1615,21 @@ class StrategyEngine:
             logger.info(f"✅ COMPLETE: {slug} | PnL: ${result.total_pnl:.2f}")
             self.notifier.send_cycle_report(result)
             
+            self._purge_slug(slug)
             return True
         
         return False
     
+    def _purge_slug(self, slug: str) -> None:
+        """
+        Drop a completed event's order bookkeeping (and its IDs in _known_filled).
+        Only _states and _results keep the slug, so memory stays flat over a long run.
+        """
+        for orders in (self._buy_orders, self._sell_orders):
+            self._known_filled.difference_update(orders.pop(slug, ()))
+        for per_slug in (self._positions, self._pending_counts, self._sl_outstanding):
+            per_slug.pop(slug, None)
+    
     def get_state(self, slug: str) -> Optional[StrategyState]:
         """Get strategy state for an event."""
         return self._states.get(slug)
@@ -1542,12 +1641,5 @@ class StrategyEngine:
     def get_pending_count(self, slug: str = None) -> int:
         """Get count of pending orders."""
         if slug:
-            buys = len([o for o in self._buy_orders.get(slug, []) if o.order_id not in self._known_filled])
-            sells = len([o for o in self._sell_orders.get(slug, []) if o.order_id not in self._known_filled])
-            stops = len([o for o in self._stop_loss_orders.get(slug, []) if o.order_id not in self._known_filled])
-            return buys + sells + stops
-        
-        total = 0
-        for s in self._states:
-            total += self.get_pending_count(s)
-        return total
+            return self._pending_counts.get(slug, 0)
+        return sum(self._pending_counts.values())